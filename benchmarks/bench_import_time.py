@@ -0,0 +1,105 @@
+# benchmarks/bench_import_time.py
+"""
+Import-time benchmark with a regression budget.
+
+Imports the test modules (what `pytest --co` does) in a fresh interpreter
+with `python -X importtime` and checks that:
+- the cumulative import time stays within the budget
+- heavy modules (selenium.webdriver) are not imported at collection time
+- importing has no side effects (no logs directory / log file created)
+
+Exits with status 1 when any check fails, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_import_time.py [--budget-ms 60] [--top 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported while collecting tests
+COLLECTED_MODULES = ("tests.conftest", "tests.test_guvi", "pages.home_page", "pages.login_page",
+                     "pages.register_page", "utilities.logger")
+
+# Modules (and their submodules) that must be deferred to first use
+FORBIDDEN_PREFIXES = ("selenium.webdriver",)
+
+# Default budget for the project's own imports, in milliseconds (pytest
+# itself is imported separately and excluded from the measurement)
+DEFAULT_BUDGET_MS = 60
+
+
+def measure(modules=COLLECTED_MODULES):
+    """
+    Import modules in a fresh interpreter with -X importtime.
+    Runs from an empty temporary directory so side effects can be detected.
+    Args:
+        modules: Module names to import.
+    Returns:
+        dict: {"entries": [(cumulative_us, self_us, name)], "total_us": int,
+               "side_effects": [paths created in the working directory]}
+    """
+    # pytest is imported first, outside the measured section
+    code = "import pytest, sys; sys.stderr.write('--measure--\\n'); import " + ", ".join(modules)
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    with tempfile.TemporaryDirectory() as cwd:
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                              cwd=cwd, env=env, capture_output=True, text=True)
+        side_effects = sorted(os.listdir(cwd))
+    if proc.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{proc.stderr}")
+
+    entries, total, measuring = [], 0, False
+    for line in proc.stderr.splitlines():
+        if line == "--measure--":
+            measuring = True
+            continue
+        if not measuring or not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entry = (int(cumulative_us), int(self_us), name.strip())
+        entries.append(entry)
+        total += entry[1]
+    return {"entries": entries, "total_us": total, "side_effects": side_effects}
+
+
+def check(result, budget_ms=DEFAULT_BUDGET_MS):
+    """
+    Check a measurement against the budget and laziness rules.
+    Args:
+        result: Output of measure().
+        budget_ms: Maximum allowed import time in milliseconds.
+    Returns:
+        list: Failure messages (empty when all checks pass).
+    """
+    failures = []
+    if result["total_us"] > budget_ms * 1000:
+        failures.append(f"import time {result['total_us'] / 1000:.1f} ms exceeds budget of {budget_ms} ms")
+    eager = sorted({name for _, _, name in result["entries"] if name.startswith(FORBIDDEN_PREFIXES)})
+    if eager:
+        failures.append(f"heavy modules imported eagerly: {', '.join(eager[:5])}")
+    if result["side_effects"]:
+        failures.append(f"import side effects in working directory: {', '.join(result['side_effects'])}")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Import time budget")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    result = measure()
+    print(f"total import time : {result['total_us'] / 1000:.1f} ms (budget {args.budget_ms} ms)")
+    print("slowest imports (cumulative):")
+    for cumulative_us, _, name in sorted(result["entries"], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failures = check(result, args.budget_ms)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,83 @@
+# benchmarks/bench_page_objects.py
+"""
+Micro-benchmark for page object construction.
+
+Measures, for one simulated test (building a HomePage, LoginPage and
+RegisterPage on the same driver and touching a lazy element):
+- construction time per test
+- memory allocated per test (tracemalloc)
+- number of allocation blocks per test
+
+No browser is launched: a minimal in-process driver stands in for
+WebDriver so only the framework overhead is measured.
+
+Usage:
+    python benchmarks/bench_page_objects.py [--tests 2000]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.home_page import HomePage  # noqa: E402
+from pages.login_page import LoginPage  # noqa: E402
+from pages.register_page import RegisterPage  # noqa: E402
+
+
+class _InProcessDriver:
+    """Just enough of the WebDriver surface for page construction."""
+    title = "GUVI"
+    current_url = "https://www.guvi.in/"
+
+    def get(self, url):
+        self.current_url = url
+
+    def find_element(self, by, value):
+        return object()
+
+
+def simulate_test(driver):
+    """Build the page objects a typical test builds."""
+    home_page = HomePage(driver)
+    login_page = LoginPage(driver)
+    register_page = RegisterPage(driver)
+    login_page.email_input  # Lazy descriptor access (no lookup until used)
+    return home_page, login_page, register_page
+
+
+def run(tests):
+    driver = _InProcessDriver()
+    simulate_test(driver)  # Warm up shared waits and loggers
+
+    start = time.perf_counter()
+    for _ in range(tests):
+        simulate_test(driver)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [simulate_test(driver) for _ in range(tests)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+
+    print(f"tests simulated        : {tests}")
+    print(f"construction per test  : {elapsed / tests * 1e6:.1f} us")
+    print(f"memory per test        : {size / tests:.0f} bytes")
+    print(f"allocations per test   : {blocks / tests:.1f} blocks")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tests", type=int, default=2000, help="Number of simulated tests")
+    args = parser.parse_args()
+    # Log formatting/IO is not part of construction cost
+    logging.disable(logging.CRITICAL)
+    run(args.tests)
@@ -1,13 +1,162 @@
 # pages/base_page.py
-from selenium.webdriver.support.ui import WebDriverWait
 import time
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from utilities.logger import logger
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from weakref import WeakKeyDictionary
+from pages.locators import By
+from utilities.lazy_import import LazyModule
 from utilities.logger import setup_logger
 
+# selenium.webdriver is only imported when a wait is first needed
+ui = LazyModule("selenium.webdriver.support.ui")
+EC = LazyModule("selenium.webdriver.support.expected_conditions")
+
+DEFAULT_WAIT = 10  # Default explicit wait in seconds
+
+
+class _DriverState:
+    """
+    State shared by every page object built on the same driver.
+    - waits: WebDriverWait instances cached per timeout
+    - epoch: navigation counter, bumped on every navigate_to()
+    """
+    __slots__ = ("waits", "epoch", "__weakref__")
+
+    def __init__(self):
+        self.waits = {}
+        self.epoch = 0
+
+
+# Per-driver shared state and per-class loggers (flyweight intrinsic state)
+_driver_states = WeakKeyDictionary()
+_strong_driver_states = {}  # id(driver) -> (driver, state) for non-weakrefable drivers
+_loggers = {}
+
+
+def _state_for(driver):
+    """
+    Return the shared state for a driver, creating it on first use.
+    Drivers that cannot be weakly referenced are cached by id(); the entry
+    keeps the driver alive so its id cannot be reused by another object,
+    until forget_driver() is called when the driver quits.
+    """
+    try:
+        state = _driver_states.get(driver)
+        if state is None:
+            state = _driver_states[driver] = _DriverState()
+        return state
+    except TypeError:
+        entry = _strong_driver_states.get(id(driver))
+        if entry is None:
+            entry = _strong_driver_states[id(driver)] = (driver, _DriverState())
+        return entry[1]
+
+
+def forget_driver(driver):
+    """
+    Drop the shared state of a driver that has quit.
+    Call after driver.quit(); page objects must not be used with it afterwards.
+    Args:
+        driver: Selenium WebDriver instance.
+    """
+    _strong_driver_states.pop(id(driver), None)
+    try:
+        _driver_states.pop(driver, None)
+    except TypeError:
+        pass  # Not weakly referenceable, so only cached by id()
+
+
+def _wait_for(driver, timeout=DEFAULT_WAIT):
+    """
+    Return a WebDriverWait for the driver, reused across pages and calls.
+    Args:
+        driver: Selenium WebDriver instance.
+        timeout: Max wait time in seconds.
+    """
+    waits = _state_for(driver).waits
+    wait = waits.get(timeout)
+    if wait is None:
+        wait = waits[timeout] = ui.WebDriverWait(driver, timeout)
+    return wait
+
+
+class Element:
+    """
+    Lazy element descriptor.
+    Declared on a page class from a locator constant, e.g.
+        email_input = Element(EMAIL_INPUT)
+    The element is only looked up on first use, then cached until the page
+    navigates or the element goes stale, after which it is re-resolved.
+    """
+    __slots__ = ("locator", "name")
+
+    def __init__(self, locator):
+        self.locator = locator
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        handle = page._elements.get(self.name)
+        if handle is None:
+            handle = page._elements[self.name] = ElementHandle(page, self.locator)
+        return handle
+
+
+class ElementHandle:
+    """
+    Cached handle to a lazily resolved web element.
+    Attribute access is forwarded to the underlying WebElement. A stale
+    element is re-resolved once and the operation retried.
+    """
+    __slots__ = ("_page", "_locator", "_element", "_epoch")
+
+    def __init__(self, page, locator):
+        self._page = page
+        self._locator = locator
+        self._element = None
+        self._epoch = -1
+
+    @property
+    def element(self):
+        """The resolved WebElement (e.g. to pass into execute_script)."""
+        epoch = _state_for(self._page.driver).epoch
+        if self._element is None or self._epoch != epoch:
+            self._element = self._page.find_element(self._locator)
+            self._epoch = epoch
+        return self._element
+
+    def invalidate(self):
+        """Drop the cached element so the next access resolves it again."""
+        self._element = None
+
+    def __getattr__(self, name):
+        try:
+            value = getattr(self.element, name)
+        except StaleElementReferenceException:
+            self._page.logger.debug(f"Stale element, re-resolving: {self._locator}")
+            self.invalidate()
+            value = getattr(self.element, name)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            try:
+                return value(*args, **kwargs)
+            except StaleElementReferenceException:
+                self._page.logger.debug(f"Stale element, re-resolving: {self._locator}")
+                self.invalidate()
+                return getattr(self.element, name)(*args, **kwargs)
+        return call
+
+
 class BasePage:
+    # Page objects are lightweight flyweights: only the driver and the lazy
+    # element cache live on the instance, waits and loggers are shared
+    __slots__ = ("driver", "_elements")
+
     def __init__(self, driver):
         """
         Initialize BasePage with WebDriver instance.
@@ -15,8 +164,21 @@ class BasePage:
             driver: Selenium WebDriver instance.
         """
         self.driver = driver
-        self.logger = setup_logger(self.__class__.__name__)  # Logger specific to the child class
-        self.wait = WebDriverWait(driver, 10)  # Default explicit wait of 10 seconds
+        self._elements = {}  # Lazy element handles, created on first access
+
+    @property
+    def logger(self):
+        """Logger specific to the child class, shared by all its instances."""
+        name = type(self).__name__
+        page_logger = _loggers.get(name)
+        if page_logger is None or not page_logger.handlers:
+            page_logger = _loggers[name] = setup_logger(name)
+        return page_logger
+
+    @property
+    def wait(self):
+        """Default explicit wait of 10 seconds, shared per driver."""
+        return _wait_for(self.driver, DEFAULT_WAIT)
 
     def find_element(self, locator):
         """
@@ -28,7 +190,9 @@ class BasePage:
         """
         try:
             self.logger.info(f"Attempting to find element: {locator}")
-            return self.wait.until(EC.presence_of_element_located(locator))
+            element = self.wait.until(EC.presence_of_element_located(locator))
+            self.logger.info(f"Found element: {locator}")
+            return element
         except TimeoutException:
             self.logger.error(f"Element not found within timeout: {locator}")
             raise
@@ -42,6 +206,7 @@ class BasePage:
             TimeoutException: If element is not clickable.
         """
         try:
+            self.logger.info(f"Attempting to click element: {locator}")
             element = self.wait.until(EC.element_to_be_clickable(locator))
             element.click()
             self.logger.info(f"Successfully clicked element: {locator}")
@@ -60,6 +225,7 @@ class BasePage:
             TimeoutException: If element is not found.
         """
         try:
+            self.logger.info(f"Attempting to get text from element: {locator}")
             element = self.find_element(locator)
             text = element.text
             self.logger.info(f"Retrieved text '{text}' from element: {locator}")
@@ -80,7 +246,8 @@ class BasePage:
         """
         try:
             time.sleep(delay_before)  # Optional delay for dynamic content
-            element = WebDriverWait(self.driver, timeout).until(
+            self.logger.info(f"Waiting for element to be visible: {locator}")
+            element = _wait_for(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             self.logger.info(f"Element is visible: {locator}")
@@ -95,7 +262,9 @@ class BasePage:
         Args:
             url: Target URL.
         """
+        self.logger.info(f"Navigating to URL: {url}")
         self.driver.get(url)
+        _state_for(self.driver).epoch += 1  # Invalidate cached element handles
         self.logger.info(f"Navigated to URL: {url}")
 
     def get_current_url(self):
@@ -119,13 +288,13 @@ class BasePage:
         """
         try:
             self.logger.info("Attempting sign-out...")
-            dropdown = WebDriverWait(self.driver, 10).until(
+            dropdown = _wait_for(self.driver, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, ".user-dropdown"))
             )
             dropdown.click()
             self.logger.debug("User dropdown clicked.")
 
-            sign_out = WebDriverWait(self.driver, 10).until(
+            sign_out = _wait_for(self.driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//a[text()='Sign Out']"))
             )
             self.driver.execute_script("arguments[0].scrollIntoView();", sign_out)
@@ -151,7 +320,8 @@ class BasePage:
             bool: True if clickable, False otherwise.
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self.logger.info(f"Waiting for element to be clickable: {locator}")
+            _wait_for(self.driver, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             self.logger.info(f"Element is clickable: {locator}")
@@ -159,6 +329,9 @@ class BasePage:
         except NoSuchElementException:
             self.logger.warning(f"Element not present: {locator}")
             return False
+        except TimeoutException:
+            self.logger.error(f"Element not clickable within {timeout}s: {locator}")
+            raise
 
     def wait_until_visible(self, by_locator, delay_before=1, timeout=15):
         """
@@ -171,11 +344,31 @@ class BasePage:
         """
         try:
             time.sleep(delay_before)
-            element = WebDriverWait(self.driver, timeout).until(
+            self.logger.info(f"Waiting for element to be visible: {by_locator}")
+            element = _wait_for(self.driver, timeout).until(
                 EC.visibility_of_element_located(by_locator)
             )
             self.logger.info(f"Element is now visible: {by_locator}")
             return element
         except TimeoutException:
             self.logger.warning(f"Element not visible within {timeout}s: {by_locator}")
-            return None
\ No newline at end of file
+            return None
+
+    def wait_until_invisible(self, locator, timeout=15):
+        """
+        Wait for an element to be hidden, removed from the DOM or replaced (stale).
+        Args:
+            locator: Tuple (By, selector).
+            timeout: Max wait time (default: 15s).
+        Returns:
+            bool: True if the element is not visible, False if still visible after timeout.
+        """
+        try:
+            _wait_for(self.driver, timeout).until(
+                EC.invisibility_of_element_located(locator)
+            )
+            self.logger.info(f"Element is not visible: {locator}")
+            return True
+        except TimeoutException:
+            self.logger.warning(f"Element still visible after {timeout}s: {locator}")
+            return False
@@ -1,10 +1,12 @@
-from selenium.webdriver.common.by import By
+from pages.locators import By
 from pages.base_page import BasePage
 from utilities.config import Config
 
 class HomePage(BasePage):
     """Page Object Model for the Home Page of the application."""
     
+    __slots__ = ()  # Flyweight: no per-instance __dict__
+
     # Locators (Private constants for better maintainability)
     LOGIN_BUTTON = (By.XPATH, "(//a[contains(text(),'Login')])[2]")
     SIGNUP_BUTTON = (By.XPATH, "//a[contains(text(),'Sign up')]")
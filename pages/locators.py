@@ -0,0 +1,17 @@
+# pages/locators.py
+class By:
+    """
+    Locator strategies, value-compatible with selenium.webdriver.common.by.By.
+
+    Importing Selenium's own By pulls in the whole `selenium.webdriver`
+    package (every browser driver), which page modules would otherwise pay
+    for at import/collection time. WebDriver accepts these plain strings.
+    """
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
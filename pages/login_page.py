@@ -1,5 +1,11 @@
-from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from pages.locators import By
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage, Element
+from utilities.lazy_import import LazyModule
+
+keys = LazyModule("selenium.webdriver.common.keys")
+
+ERROR_CLEAR_TIMEOUT = 3  # Seconds to wait for a previous case's error message to disappear
 
 class LoginPage(BasePage):
     """
@@ -7,6 +13,8 @@ class LoginPage(BasePage):
     Handles authentication workflows and error message validation.
     """
     
+    __slots__ = ()  # Flyweight: no per-instance __dict__
+
     # Locators
     EMAIL_INPUT = (By.ID, "email")  # Email input field
     PASSWORD_INPUT = (By.ID, "password")  # Password input field
@@ -14,6 +22,10 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (By.XPATH, "(//div[contains(@class,'invalid-feedback')])[2]")  # Auth error message
     LOGOUT_BUTTON = (By.XPATH, "//li[@id='dropdown_contents']//div[contains(text(),'Sign Out')]")  # Logout option
     PROFILE_ICON = (By.XPATH, "//div[@id='dropdown_title']//img[@id='dropdown_contents']")  # Profile dropdown
+
+    # Lazy elements (resolved on first use, re-resolved after navigation or staleness)
+    email_input = Element(EMAIL_INPUT)
+    password_input = Element(PASSWORD_INPUT)
     
     def __init__(self, driver):
         """
@@ -31,7 +43,7 @@ class LoginPage(BasePage):
             email: String to input
         """
         self.logger.info(f"Entering email: {email}")
-        self.find_element(self.EMAIL_INPUT).send_keys(email)
+        self.email_input.send_keys(email)
         self.logger.debug("Email entered successfully")
 
     def enter_password(self, password):
@@ -41,7 +53,7 @@ class LoginPage(BasePage):
             password: String to input
         """
         self.logger.info("Entering password (masked for security)")
-        self.find_element(self.PASSWORD_INPUT).send_keys(password)
+        self.password_input.send_keys(password)
         self.logger.debug("Password entered successfully")
 
     def click_login_button(self):
@@ -63,6 +75,39 @@ class LoginPage(BasePage):
         self.click_login_button()
         self.logger.info("Login sequence completed")
 
+    def reset_form(self):
+        """
+        Clear the email and password fields so the next data-driven case can
+        reuse the already loaded login page instead of reloading it.
+        The previous case's error message must be gone before the next submit,
+        otherwise its text would be read as the new case's result. If the page
+        keeps showing it, the login page is reloaded.
+        """
+        for field in (self.email_input, self.password_input):
+            field.clear()
+            if field.get_attribute("value"):
+                # Framework-controlled inputs may ignore clear(); select all and delete
+                field.send_keys(keys.Keys.CONTROL, "a")
+                field.send_keys(keys.Keys.DELETE)
+        if not self.wait_until_invisible(self.ERROR_MESSAGE, timeout=ERROR_CLEAR_TIMEOUT):
+            self.logger.info("Previous error message still shown, reloading login page")
+            self.navigate_to(self.driver.current_url)
+            if not self.wait_until_invisible(self.ERROR_MESSAGE, timeout=ERROR_CLEAR_TIMEOUT):
+                raise TimeoutException(f"Error message still shown after reloading: {self.ERROR_MESSAGE}")
+        self.logger.debug("Login form reset")
+
+    def wait_for_error_message(self, timeout=5):
+        """
+        Check for the authentication error without the initial delay used by
+        is_error_message_displayed (for high-volume data-driven runs).
+        Call reset_form() before submitting, so a visible message is a new one.
+        Args:
+            timeout: Max wait time in seconds (default: 5)
+        Returns:
+            bool: True if the error message became visible
+        """
+        return self.is_element_visible(self.ERROR_MESSAGE, delay_before=0, timeout=timeout)
+
     def is_error_message_displayed(self):
         """Check if authentication error message is visible."""
         is_visible = self.is_element_visible(self.ERROR_MESSAGE)
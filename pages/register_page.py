@@ -1,4 +1,4 @@
-from selenium.webdriver.common.by import By
+from pages.locators import By
 from pages.base_page import BasePage
 
 class RegisterPage(BasePage):
@@ -7,6 +7,8 @@ class RegisterPage(BasePage):
     Handles user registration flow and page validation.
     """
 
+    __slots__ = ()  # Flyweight: no per-instance __dict__
+
     # Locators
     REGISTER_HEADER = (By.XPATH, "//h2[contains(text(),'Sign Up')]")  # Main header element indicating registration page
     
@@ -1,9 +1,51 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from utilities.config import Config
 from utilities.logger import setup_logger
+from utilities.lazy_import import LazyModule
 import logging
+from utilities.impact import ImpactPlugin
+from utilities.watchdog import SessionWatchdog
+from utilities.stream_report import StreamReportPlugin
+from utilities.browser_events import BrowserEventCollector
+from pages.base_page import forget_driver
+
+# Selenium is imported when the first browser is launched, not at collection
+webdriver = LazyModule("selenium.webdriver")
+
+
+def pytest_addoption(parser):
+    """
+    Register command line options.
+    - --impact-record: record which pages, methods and locators each test touches
+    - --impact-select: run only tests affected by changes since the last recording
+    - --impact-index: location of the impact index file
+    - --stream-report: directory for the streaming (NDJSON) test report
+    """
+    group = parser.getgroup("impact", "test impact analysis")
+    group.addoption("--impact-record", action="store_true", default=False,
+                    help="Record page/locator dependencies of executed tests")
+    group.addoption("--impact-select", action="store_true", default=False,
+                    help="Run only tests affected by changed page objects or locators")
+    group.addoption("--impact-index", default=None,
+                    help="Path of the impact index (default: <rootdir>/.impact_index.json)")
+
+    parser.getgroup("stream-report", "streaming test report").addoption(
+        "--stream-report", default=None, metavar="DIR",
+        help="Stream one NDJSON record per test into DIR (with artifacts and a static viewer)")
+
+
+def pytest_configure(config):
+    """Register the impact analysis and streaming report plugins when requested."""
+    record = config.getoption("--impact-record")
+    select = config.getoption("--impact-select")
+    if record or select:
+        plugin = ImpactPlugin(config, record=record, select=select,
+                              index_path=config.getoption("--impact-index"))
+        config.pluginmanager.register(plugin, "impact")
+
+    report_dir = config.getoption("--stream-report")
+    if report_dir:
+        config.pluginmanager.register(StreamReportPlugin(config, report_dir), "stream-report")
 
 @pytest.fixture(scope="class")
 def driver_init(request):
@@ -34,23 +76,13 @@ def driver_init(request):
     logger.info(f"Initializing WebDriver for {test_class_name}")
     
     try:
-        # Configure Chrome browser options
-        chrome_options = Options()
-        chrome_options.add_argument("--incognito")  # Private browsing mode
-        chrome_options.add_argument("--disable-infobars")  # Hide info bars
-        chrome_options.add_argument("--disable-extensions")  # Disable extensions
-        
-        logger.info("Launching Chrome browser with configured options")
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        # Navigate to base URL and maximize window
-        logger.info(f"Navigating to application URL: {Config.BASE_URL}")
-        driver.get(Config.BASE_URL)
-        driver.maximize_window()  # Ensure consistent viewport size
+        driver = launch_driver(logger)
         
         # Make driver and logger available to test class
         request.cls.driver = driver
         request.cls.logger = logger
+        request.cls.watchdog = start_watchdog(driver, test_class_name)
+        request.cls.browser_events = start_event_collector(driver, test_class_name)
         
         # Fixture pause point - execution returns here after test class completes
         yield driver
@@ -63,14 +95,115 @@ def driver_init(request):
     finally:
         # Teardown block - runs regardless of test success/failure
         logger.info("Initiating WebDriver cleanup")
-        if 'driver' in locals():  # Safely check if driver exists
-            driver.quit()  # Properly close browser session
+        watchdog = getattr(request.cls, "watchdog", None)
+        if watchdog is not None:
+            watchdog.stop()
+            request.cls.watchdog = None
+        browser_events = getattr(request.cls, "browser_events", None)
+        if browser_events is not None:
+            browser_events.stop()
+            request.cls.browser_events = None
+        # The session may have been recycled, so quit the class's current driver
+        current = getattr(request.cls, "driver", None) or locals().get("driver")
+        if current is not None:
+            current.quit()  # Properly close browser session
+            forget_driver(current)  # Release its shared page object state
         
         # Clean up logger handlers to prevent memory leaks
         for handler in logger.handlers[:]:
             handler.close()
             logger.removeHandler(handler)
 
+
+def launch_driver(logger):
+    """
+    Launch a configured Chrome session on the application URL.
+    Args:
+        logger: Logger for setup messages
+    Returns:
+        WebDriver: Ready-to-use Chrome driver
+    """
+    # Configure Chrome browser options
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--incognito")  # Private browsing mode
+    chrome_options.add_argument("--disable-infobars")  # Hide info bars
+    chrome_options.add_argument("--disable-extensions")  # Disable extensions
+    
+    logger.info("Launching Chrome browser with configured options")
+    driver = webdriver.Chrome(options=chrome_options)
+    
+    # Navigate to base URL and maximize window
+    logger.info(f"Navigating to application URL: {Config.BASE_URL}")
+    driver.get(Config.BASE_URL)
+    driver.maximize_window()  # Ensure consistent viewport size
+    return driver
+
+
+def start_watchdog(driver, session_name):
+    """Start a resource watchdog for the session if enabled in Config."""
+    if not Config.WATCHDOG_ENABLED:
+        return None
+    watchdog = SessionWatchdog(driver, session_name)
+    watchdog.start()
+    return watchdog
+
+
+def start_event_collector(driver, session_name):
+    """Subscribe to the session's browser error events if enabled in Config."""
+    if not Config.BROWSER_EVENTS_ENABLED:
+        return None
+    collector = BrowserEventCollector(driver, session_name)
+    return collector if collector.start() else None
+
+
+@pytest.fixture(autouse=True)
+def recycle_bloated_session(request):
+    """
+    Recycle the class's browser between tests once its watchdog has flagged
+    it (JS heap, DOM nodes or RSS over the Config thresholds).
+    Tests without a watched driver are unaffected.
+    """
+    cls = getattr(request, "cls", None)
+    watchdog = getattr(cls, "watchdog", None)
+    if watchdog is not None and watchdog.needs_recycle:
+        logger = cls.logger
+        logger.warning(f"Recycling browser session: {watchdog.recycle_reason}")
+        watchdog.stop()
+        if getattr(cls, "browser_events", None) is not None:
+            cls.browser_events.stop()
+        try:
+            cls.driver.quit()
+        except Exception as e:
+            logger.warning(f"Quitting bloated session failed: {str(e)}")
+        forget_driver(cls.driver)
+        cls.driver = launch_driver(logger)
+        cls.watchdog = start_watchdog(cls.driver, cls.__name__)
+        cls.browser_events = start_event_collector(cls.driver, cls.__name__)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def collect_browser_events(request, recycle_bloated_session):
+    """
+    Give every browser test its own buffer of console errors, uncaught
+    exceptions and failed requests, and attach them to the test report
+    (user property "browser_events", shown in the streaming report).
+    Tests can assert cheaply with:
+        self.browser_events.assert_no_new_console_errors()
+    """
+    collector = getattr(getattr(request, "cls", None), "browser_events", None)
+    if collector is None:
+        yield
+        return
+    collector.start_test()
+    yield
+    events = collector.finish_test()
+    if events:
+        request.node.user_properties.append(("browser_events", events))
+        errors = sum(1 for e in events if e["kind"] != "network")
+        request.cls.logger.info(f"Browser events for {request.node.name}: "
+                                f"{errors} console/JS error(s), {len(events) - errors} failed request(s)")
+
 @pytest.fixture(scope="function")
 def test_logger(request):
     """
@@ -0,0 +1,673 @@
+import os
+import pytest
+import textwrap
+from utilities.impact import PageModel, ImpactRecorder, global_fingerprints, select_tests
+
+
+def _write(root, rel, content):
+    path = os.path.join(str(root), rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(textwrap.dedent(content))
+    return path
+
+
+PAGES = """
+    class BasePage:
+        def click_element(self, locator):
+            return locator
+
+    class HomePage(BasePage):
+        LOGIN_BUTTON = ("xpath", "//a[@id='login']")
+        SIGNUP_BUTTON = ("xpath", "//a[@id='signup']")
+
+        def click_login(self):
+            return self.click_element(self.LOGIN_BUTTON)
+
+        def click_signup(self):
+            return self.click_element(self.SIGNUP_BUTTON)
+"""
+
+
+class TestImpactAnalysis:
+    """Unit tests for utilities.impact (no browser required)"""
+
+    def test_methods_map_to_their_locators(self, tmp_path):
+        _write(tmp_path, "pages/home_page.py", PAGES)
+        model = PageModel(str(tmp_path))
+        assert model.method_locators["HomePage.click_login"] == {"HomePage.LOGIN_BUTTON"}
+        deps = model.expand({"HomePage.click_signup", "BasePage.click_element"})
+        assert "HomePage.SIGNUP_BUTTON" in deps
+        assert "HomePage.LOGIN_BUTTON" not in deps
+        assert "pages.home_page" in deps
+
+    def test_only_tests_using_changed_locator_are_selected(self, tmp_path):
+        _write(tmp_path, "pages/home_page.py", PAGES)
+        root = str(tmp_path)
+        model = PageModel(root)
+
+        def entry(*methods):
+            units = model.expand(set(methods))
+            return {"fingerprint": "f", "units": {u: model.units[u] for u in units}}
+
+        index = {
+            "version": 1,
+            "global": global_fingerprints(root),
+            "tests": {"t::login": entry("HomePage.click_login"),
+                      "t::signup": entry("HomePage.click_signup")},
+        }
+        tests = {"t::login": ("f", "t", "m"), "t::signup": ("f", "t", "m"), "t::new": ("f", "t", "m")}
+
+        _write(tmp_path, "pages/home_page.py", PAGES.replace("//a[@id='login']", "//a[@id='sign-in']"))
+        selected, _ = select_tests(index, root, tests)
+        assert selected == {"t::login", "t::new"}
+
+        _write(tmp_path, "utilities/config.py", "BASE_URL = 'x'\n")
+        selected, reason = select_tests(index, root, tests)
+        assert selected is None and "utilities/config.py" in reason
+
+    def test_test_data_changes_select_full_suite(self, tmp_path):
+        _write(tmp_path, "test_data/cases.csv", "id,email\na,x@example.com\n")
+        root = str(tmp_path)
+        index = {"version": 1, "global": global_fingerprints(root), "tests": {}}
+        tests = {"t::data": ("f", "t", "m")}
+        assert select_tests(index, root, {}) == (set(), "0 changed unit(s)")
+
+        _write(tmp_path, "test_data/cases.csv", "id,email\na,x@example.com\nb,y@example.com\n")
+        selected, reason = select_tests(index, root, tests)
+        assert selected is None and "test_data/cases.csv" in reason
+
+        os.remove(os.path.join(root, "test_data", "cases.csv"))
+        selected, reason = select_tests(index, root, tests)
+        assert selected is None and "test_data/cases.csv" in reason
+
+    def test_recorder_captures_page_method_calls(self):
+        import logging
+        from types import SimpleNamespace
+        from pages.base_page import BasePage
+
+        page = SimpleNamespace(driver=SimpleNamespace(title="GUVI"), logger=logging.getLogger("impact"))
+        recorder = ImpactRecorder(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        recorder.start()
+        try:
+            BasePage.get_page_title(page)
+        finally:
+            touched = recorder.stop()
+        assert touched == {"BasePage.get_page_title"}
+
+    def test_xdist_workers_merge_into_one_index_and_empty_selection_passes(self, tmp_path):
+        import json
+        import subprocess
+        import sys
+        pytest.importorskip("xdist")
+
+        _write(tmp_path, "pages/__init__.py", "")
+        _write(tmp_path, "pages/home_page.py", PAGES)
+        _write(tmp_path, "conftest.py", """
+            import os
+            from utilities.impact import ImpactPlugin
+
+            def pytest_configure(config):
+                mode = os.environ["IMPACT_MODE"]
+                plugin = ImpactPlugin(config, record=mode == "record", select=mode == "select")
+                config.pluginmanager.register(plugin, "impact")
+        """)
+        _write(tmp_path, "tests/test_pages.py", "from pages.home_page import HomePage\n" + "".join(
+            f"\ndef test_{i}():\n    HomePage().click_{'login' if i % 2 else 'signup'}()\n" for i in range(6)))
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        def run(mode, *args):
+            return subprocess.run(
+                [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "--rootdir", str(tmp_path), "tests", *args],
+                cwd=str(tmp_path), env=dict(os.environ, IMPACT_MODE=mode, PYTHONPATH=root),
+                capture_output=True, text=True)
+
+        recorded = run("record", "-n", "2")
+        assert recorded.returncode == 0, recorded.stdout
+        with open(tmp_path / ".impact_index.json") as fh:
+            tests = json.load(fh)["tests"]
+        assert len(tests) == 6
+        assert "HomePage.LOGIN_BUTTON" in tests["tests/test_pages.py::test_1"]["units"]
+
+        for args in ((), ("-n", "2")):
+            selected = run("select", *args)
+            assert selected.returncode == 0, selected.stdout  # Not 5: nothing was affected
+            assert "impact: selected 0 of 6 tests" in selected.stdout
+
+        _write(tmp_path, "pages/home_page.py", PAGES.replace("//a[@id='login']", "//a[@id='sign-in']"))
+        selected = run("select", "-n", "2")
+        assert selected.returncode == 0 and "3 passed" in selected.stdout, selected.stdout
+
+
+class TestLazyElements:
+    """Unit tests for lazy element descriptors and flyweight page objects"""
+
+    class _Driver:
+        def __init__(self):
+            self.lookups = 0
+            self.stale = False
+
+        def get(self, url):
+            pass
+
+        def find_element(self, by, value):
+            from selenium.common.exceptions import StaleElementReferenceException
+            self.lookups += 1
+            driver = self
+
+            class _WebElement:
+                def send_keys(self, text):
+                    if driver.stale:
+                        driver.stale = False
+                        raise StaleElementReferenceException("stale")
+                    return text
+            return _WebElement()
+
+    def test_element_is_resolved_once_and_re_resolved_when_stale(self):
+        from pages.login_page import LoginPage
+
+        driver = self._Driver()
+        page = LoginPage(driver)
+        assert driver.lookups == 0  # Nothing resolved at construction
+        page.email_input.send_keys("a")
+        page.email_input.send_keys("b")
+        assert driver.lookups == 1
+
+        driver.stale = True
+        assert page.email_input.send_keys("c") == "c"
+        assert driver.lookups == 2
+
+        page.navigate_to("https://www.guvi.in")
+        page.email_input.send_keys("d")
+        assert driver.lookups == 3
+
+    def test_pages_share_waits_and_have_no_instance_dict(self):
+        from pages.login_page import LoginPage
+
+        driver = self._Driver()
+        first, second = LoginPage(driver), LoginPage(driver)
+        assert first.wait is second.wait
+        assert first.logger is second.logger
+        assert not hasattr(first, "__dict__")
+
+    def test_state_is_shared_for_drivers_without_weak_references(self):
+        from pages.base_page import _state_for
+        from pages.login_page import LoginPage
+
+        class _SlotsDriver:
+            __slots__ = ("lookups",)
+
+            def __init__(self):
+                self.lookups = 0
+
+            def get(self, url):
+                pass
+
+            def find_element(self, by, value):
+                self.lookups += 1
+                return self
+
+            def send_keys(self, text):
+                return text
+
+        driver = _SlotsDriver()
+        page = LoginPage(driver)
+        assert page.wait is LoginPage(driver).wait
+        page.email_input.send_keys("a")
+        epoch = _state_for(driver).epoch
+        page.navigate_to("https://www.guvi.in")
+        assert _state_for(driver).epoch == epoch + 1
+        page.email_input.send_keys("b")
+        assert driver.lookups == 2  # Re-resolved after navigation
+
+        from pages.base_page import _strong_driver_states, forget_driver
+        forget_driver(driver)
+        assert id(driver) not in _strong_driver_states
+
+
+class TestImportTime:
+    """Collection must stay lazy: no selenium.webdriver and no log files on import"""
+
+    def test_collection_imports_are_lazy(self):
+        from benchmarks.bench_import_time import measure, check
+
+        # Timing is covered by the benchmark itself; only laziness is asserted here
+        failures = check(measure(), budget_ms=float("inf"))
+        assert failures == []
+
+
+class TestDistributedQueue:
+    """Coordinator and agents talking over localhost sockets"""
+
+    def test_agents_share_work_and_fast_agent_steals(self):
+        import threading
+        import time
+        from utilities.distributed import Coordinator, AgentClient
+
+        nodeids = [f"t.py::TestA::test_{i}" for i in range(3)] + [f"t.py::TestB::test_{i}" for i in range(3)]
+        coordinator = Coordinator(nodeids, host="127.0.0.1", port=0)
+        coordinator.start()
+
+        def agent(name, delay):
+            client = AgentClient(*coordinator.address, name=name)
+            while True:
+                nodeid = client.next()
+                if nodeid is None:
+                    break
+                time.sleep(delay)
+                client.report({"nodeid": nodeid, "outcome": "passed", "duration": delay})
+            client.close()
+
+        threads = [threading.Thread(target=agent, args=("slow", 0.3)),
+                   threading.Thread(target=agent, args=("fast", 0.0))]
+        threads[0].start()
+        time.sleep(0.1)  # Let the slow agent claim its group first
+        threads[1].start()
+        for thread in threads:
+            thread.join(10)
+
+        assert coordinator.wait(5)
+        assert sorted(coordinator.results) == sorted(nodeids)
+        assert coordinator.steals >= 1
+        by_agent = [r["agent"] for r in coordinator.results.values()]
+        assert by_agent.count("fast") >= 4
+
+    def test_agent_processes_run_a_generated_module(self, tmp_path):
+        import subprocess
+        import sys
+        import textwrap
+        from utilities.distributed import Coordinator, collect_nodeids
+
+        module = tmp_path / "test_generated.py"
+        module.write_text(textwrap.dedent("""
+            import os, time, pytest
+
+            def _log(event):
+                with open(os.environ["DISTRIBUTED_TEST_LOG"], "a") as fh:
+                    fh.write(f"{os.getpid()} {event}\\n")
+
+            @pytest.fixture(scope="class")
+            def browser(request):
+                _log(f"setup {request.cls.__name__}")
+                yield
+                _log(f"teardown {request.cls.__name__}")
+
+            @pytest.mark.usefixtures("browser")
+            class TestA:
+                def test_pass(self):
+                    time.sleep(0.5)
+
+                def test_fail(self):
+                    time.sleep(0.5)
+                    assert False, "expected failure"
+
+                def test_skip(self):
+                    pytest.skip("not today")
+
+            @pytest.mark.usefixtures("browser")
+            class TestB:
+                def test_one(self):
+                    time.sleep(0.5)
+
+                def test_two(self):
+                    time.sleep(0.5)
+        """))
+        log = tmp_path / "fixtures.log"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        pytest_args = [str(module), "--rootdir", str(tmp_path), "-p", "no:cacheprovider"]
+
+        nodeids = collect_nodeids(pytest_args)
+        assert len(nodeids) == 5
+        missing = "test_generated.py::TestC::test_gone"  # Known to the coordinator only
+        coordinator = Coordinator(nodeids + [missing], host="127.0.0.1", port=0)
+        coordinator.start()
+        agents = subprocess.Popen(
+            [sys.executable, "-m", "utilities.distributed", "agent", "--host", "127.0.0.1",
+             "--port", str(coordinator.address[1]), "--count", "2", "--", *pytest_args],
+            cwd=root, env=dict(os.environ, DISTRIBUTED_TEST_LOG=str(log)),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            assert coordinator.wait(60)
+            agents.wait(60)
+        finally:
+            agents.kill()
+
+        outcomes = {nodeid.rsplit("::", 2)[-2] + "." + nodeid.rsplit("::", 1)[-1]: result["outcome"]
+                    for nodeid, result in coordinator.results.items()}
+        assert outcomes == {"TestA.test_pass": "passed", "TestA.test_fail": "failed", "TestA.test_skip": "skipped",
+                            "TestB.test_one": "passed", "TestB.test_two": "passed", "TestC.test_gone": "error"}
+        assert "expected failure" in coordinator.results[nodeids[1]]["longrepr"]
+        assert len({r["agent"] for r in coordinator.results.values()}) == 2
+
+        # Class fixtures are set up once per agent and class, and always torn down
+        events = [line.split(" ", 1) for line in log.read_text().splitlines()]
+        setups = [(pid, e[len("setup "):]) for pid, e in events if e.startswith("setup ")]
+        teardowns = [(pid, e[len("teardown "):]) for pid, e in events if e.startswith("teardown ")]
+        assert len(setups) == len(set(setups)) and sorted(setups) == sorted(teardowns)
+
+
+class TestSessionWatchdog:
+    """Resource sampling and recycle flagging (no browser required)"""
+
+    def test_threshold_crossing_flags_session_and_logs_curve(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from utilities.watchdog import SessionWatchdog
+
+        monkeypatch.chdir(tmp_path)
+        driver = SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(pid=os.getpid())))
+        watchdog = SessionWatchdog(driver, "TestWatch", max_js_heap_mb=200, max_rss_mb=10 ** 6)
+        first = watchdog.sample({"JSHeapUsedSize": 100 * 1048576, "Nodes": 1200})
+        assert first["js_heap_mb"] == 100.0 and first["dom_nodes"] == 1200
+        assert first["rss_mb"] > 0
+        assert not watchdog.needs_recycle
+
+        watchdog.sample({"JSHeapUsedSize": 300 * 1048576, "Nodes": 1200})
+        assert watchdog.needs_recycle and "js_heap_mb" in watchdog.recycle_reason
+        with open(watchdog.curve_file) as fh:
+            assert len(fh.readlines()) == 3  # Header and two samples
+
+    def test_missing_proc_gives_no_rss_and_zero_threshold_is_kept(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from utilities import watchdog as watchdog_module
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(watchdog_module, "PROC_DIR", str(tmp_path / "no-proc"))
+        driver = SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(pid=os.getpid())))
+        watchdog = watchdog_module.SessionWatchdog(driver, "TestNoProc", max_dom_nodes=0)
+        assert watchdog.thresholds["dom_nodes"] == 0
+        sample = watchdog.sample({"Nodes": 1})
+        assert sample["rss_mb"] is None
+        assert watchdog.needs_recycle and "dom_nodes" in watchdog.recycle_reason
+
+    def test_background_sampling_never_uses_the_test_webdriver(self, tmp_path, monkeypatch):
+        import time
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace as NS
+        from utilities import watchdog as watchdog_module
+
+        class _Driver:
+            caps = {}
+            current_window_handle = "TAB"
+
+            def _get_cdp_details(self):
+                raise RuntimeError("no DevTools endpoint")
+
+            def execute_cdp_cmd(self, cmd, params):
+                raise AssertionError("watchdog thread used the test's WebDriver")
+
+        def run(watchdog):
+            watchdog.start()
+            try:
+                deadline = time.time() + 5
+                while watchdog.last_sample is None and time.time() < deadline:
+                    time.sleep(0.05)
+            finally:
+                watchdog.stop()
+            return watchdog.last_sample
+
+        monkeypatch.chdir(tmp_path)
+        sample = run(watchdog_module.SessionWatchdog(_Driver(), "TestThread", interval=0.05))
+        assert sample is not None and sample["js_heap_mb"] is None  # RSS only
+
+        attached = []
+
+        class _Session:
+            async def execute(self, command):
+                return command
+
+        @asynccontextmanager
+        async def page_session(driver, target_id=None):
+            attached.append(target_id)
+            metrics = [NS(name="JSHeapUsedSize", value=64 * 1048576), NS(name="Nodes", value=10)]
+            yield NS(session=_Session(), devtools=NS(performance=NS(enable=lambda: None, get_metrics=lambda: metrics)))
+
+        monkeypatch.setattr(watchdog_module, "page_session", page_session)
+        sample = run(watchdog_module.SessionWatchdog(_Driver(), "TestTarget", interval=0.05))
+        assert attached == ["TAB"] and sample["js_heap_mb"] == 64.0 and sample["dom_nodes"] == 10
+
+
+class TestStreamReport:
+    """Segmented NDJSON report writer"""
+
+    def test_records_are_streamed_into_segments(self, tmp_path):
+        import json
+        from utilities.stream_report import StreamReportWriter
+
+        writer = StreamReportWriter(str(tmp_path), segment_size=2)
+        for i, outcome in enumerate(["passed", "failed", "passed", "passed", "skipped"]):
+            writer.write({"nodeid": f"t::test_{i}", "outcome": outcome})
+            with open(tmp_path / "manifest.json") as fh:
+                manifest = json.load(fh)
+            assert manifest["total"] == i + 1 and manifest["status"] == "running"
+        writer.close()
+
+        with open(tmp_path / "manifest.json") as fh:
+            manifest = json.load(fh)
+        assert manifest["status"] == "finished"
+        assert manifest["summary"] == {"passed": 3, "failed": 1, "skipped": 1}
+        assert [s["count"] for s in manifest["segments"]] == [2, 2, 1]
+        with open(tmp_path / manifest["segments"][2]["file"]) as fh:
+            assert json.loads(fh.read())["nodeid"] == "t::test_4"
+        assert (tmp_path / "index.html").exists()
+
+        (tmp_path / "artifacts" / "t_test_1.png").write_bytes(b"png")
+        StreamReportWriter(str(tmp_path), segment_size=2).close()
+        assert os.listdir(tmp_path / "artifacts") == []
+        assert not list(tmp_path.glob("records-*.ndjson"))
+
+
+class TestLogAnalytics:
+    """Incremental log indexing and per-locator latency stats"""
+
+    def test_latency_and_timeout_rate_per_locator(self, tmp_path):
+        from utilities.log_analytics import LogIndex
+
+        log = tmp_path / "guvi_test_1.log"
+        log.write_text(
+            "2025-08-21 16:27:41.000 - TestGUVI - INFO - Executing Test Case 6: Verify invalid login\n"
+            "2025-08-21 16:27:42.000 - LoginPage - INFO - Attempting to find element: ('id', 'email')\n"
+            "2025-08-21 16:27:42.250 - LoginPage - INFO - Retrieved text 'x' from element: ('id', 'email')\n"
+            "2025-08-21 16:27:43.000 - LoginPage - INFO - Attempting to click element: ('id', 'btn')\n"
+            "2025-08-21 16:27:43.500 - LoginPage - INFO - Successfully clicked element: ('id', 'btn')\n"
+            "2025-08-21 16:27:48.000 - HomePage - INFO - Navigated to URL: https://www.guvi.in\n"
+        )
+        index = LogIndex(str(tmp_path / "index.sqlite"), str(tmp_path))
+        index.update()
+        with open(log, "a") as fh:
+            fh.write("2025-08-21 16:27:44.000 - LoginPage - INFO - Attempting to click element: ('id', 'btn')\n"
+                     "2025-08-21 16:27:50.000 - HomePage - INFO - Attempting to click element: ('id', 'btn')\n"
+                     "2025-08-21 16:28:04.000 - LoginPage - ERROR - Element not clickable: ('id', 'btn')\n"
+                     "2025-08-21 16:28:05.000 - LoginPage - INFO - Attempting to find element: ('id', 'x')\n"
+                     "2025-08-21 16:28:05.100 - LoginPage - INFO - Found element: ('id', 'x')\n")
+        index.update()
+
+        rows = {(r["page"], r["locator"], r["op"]): r for r in index.stats()}
+        assert rows[("LoginPage", "('id', 'email')", "get_text")]["max_ms"] == 250.0
+        click = rows[("LoginPage", "('id', 'btn')", "click")]
+        assert click["count"] == 2 and click["timeout_rate"] == 0.5 and click["unpaired"] == 0
+        assert click["max_ms"] == 20000.0  # Paired with its own logger's start
+        find = rows[("LoginPage", "('id', 'x')", "find")]
+        assert find["timeout_rate"] == 0.0 and find["max_ms"] == 100.0
+        navigate = rows[("HomePage", "https://www.guvi.in", "navigate")]
+        assert navigate["unpaired"] == 1 and navigate["p50_ms"] is None
+        assert ("HomePage", "('id', 'btn')", "click") not in rows  # Started, never ended
+        by_test = index.stats(by=["test"], test="Test Case 6")
+        assert by_test[0]["count"] == 5
+        index.close()
+
+    def test_clickable_timeouts_and_abandoned_starts_count_as_timeouts(self, tmp_path, caplog):
+        from selenium.common.exceptions import NoSuchElementException, TimeoutException
+        from pages.base_page import BasePage
+        from utilities.log_analytics import LogIndex
+
+        class _Driver:
+            def find_element(self, by, value):
+                raise NoSuchElementException("missing")
+
+        with pytest.raises(TimeoutException):
+            BasePage(_Driver()).is_element_clickable(("id", "gone"), timeout=0.1)
+        assert "Element not clickable within 0.1s: ('id', 'gone')" in caplog.text
+
+        (tmp_path / "guvi_test_1.log").write_text(
+            "2025-08-22 10:00:00.000 - TestGUVI - INFO - Executing Test Case 1: Clickable\n"
+            "2025-08-22 10:00:01.000 - HomePage - INFO - Waiting for element to be clickable: ('id', 'gone')\n"
+            "2025-08-22 10:00:21.000 - HomePage - ERROR - Element not clickable within 20s: ('id', 'gone')\n"
+            "2025-08-22 10:00:22.000 - HomePage - INFO - Navigating to URL: https://www.guvi.in\n"
+            "2025-08-22 10:00:30.000 - TestGUVI - INFO - Executing Test Case 2: Next\n"
+        )
+        (tmp_path / "guvi_test_0.log").write_text(  # Older log: successful finds logged no end
+            "2025-08-20 10:00:00.000 - TestGUVI - INFO - Executing Test Case 1: Old\n"
+            "2025-08-20 10:00:01.000 - HomePage - INFO - Attempting to find element: ('id', 'old')\n"
+            "2025-08-20 10:00:30.000 - TestGUVI - INFO - Executing Test Case 2: Old\n"
+        )
+        index = LogIndex(str(tmp_path / "index.sqlite"), str(tmp_path))
+        index.update()
+        rows = {(r["locator"], r["op"]): r for r in index.stats()}
+        clickable = rows[("('id', 'gone')", "clickable")]
+        assert clickable["timeout_rate"] == 1.0 and clickable["max_ms"] == 20000.0
+        navigate = rows[("https://www.guvi.in", "navigate")]
+        assert navigate["abandoned"] == 1 and navigate["timeout_rate"] == 1.0 and navigate["p50_ms"] is None
+        assert index.stats(by=["test"], op="navigate")[0]["test"] == "Test Case 1: Clickable"
+        assert ("('id', 'old')", "find") not in rows
+        index.close()
+
+
+class TestDataProvider:
+    """Lazy case streaming, matrices and deterministic sharding"""
+
+    def test_shards_are_disjoint_complete_and_stable(self, tmp_path):
+        import itertools
+        from utilities.data_provider import stream_cases, matrix, matrix_size, shard
+
+        jsonl = tmp_path / "cases.jsonl"
+        jsonl.write_text('{"email": "a@x.com", "password": "1"}\n\n{"id": "b", "email": "b", "password": ""}\n')
+        assert [c["case_id"] for c in stream_cases(str(jsonl))] == ["cases.jsonl:1", "b"]
+
+        axes = dict(email=["e%d" % i for i in range(30)], password=["p%d" % i for i in range(40)])
+        assert matrix_size(**axes) == 1200
+        first = next(matrix(**axes))
+        assert first["case_id"] == "matrix:email=e0|password=p0"
+
+        def all_cases():
+            return itertools.chain(stream_cases(str(jsonl)), matrix(**axes))
+
+        shards = [[c["case_id"] for c in shard(all_cases(), i, 4)] for i in range(4)]
+        ids = [case_id for ids in shards for case_id in ids]
+        assert len(ids) == len(set(ids)) == 1202
+        assert shards == [[c["case_id"] for c in shard(all_cases(), i, 4)] for i in range(4)]
+
+    def test_reset_form_never_leaves_previous_error_visible(self, monkeypatch):
+        from pages import login_page
+        from pages.login_page import LoginPage
+
+        class _Element:
+            def __init__(self, driver, error=False):
+                self.driver, self.error = driver, error
+
+            def is_displayed(self):
+                return self.error and self.driver.error_shown
+
+            def clear(self):
+                self.driver.error_shown = self.driver.error_shown and not self.driver.clears_error
+
+            def get_attribute(self, name):
+                return ""
+
+        class _Driver:
+            current_url = "https://www.guvi.in/sign-in/"
+
+            def __init__(self, clears_error):
+                self.clears_error, self.error_shown, self.reloads = clears_error, True, 0
+
+            def get(self, url):
+                self.reloads += 1
+                self.error_shown = False
+
+            def find_element(self, by, value):
+                return _Element(self, error=(by, value) == LoginPage.ERROR_MESSAGE)
+
+        monkeypatch.setattr(login_page, "ERROR_CLEAR_TIMEOUT", 0.2)
+        for clears_error, reloads in ((True, 0), (False, 1)):
+            driver = _Driver(clears_error)
+            LoginPage(driver).reset_form()
+            assert not driver.error_shown and driver.reloads == reloads
+
+
+class TestBrowserEvents:
+    """CDP event translation and per-test buffers (no browser required)"""
+
+    def test_events_are_buffered_per_test(self):
+        from types import SimpleNamespace as NS
+        from utilities.browser_events import BrowserEventCollector
+
+        def event(name, **fields):
+            return type(name, (NS,), {})(**fields)
+
+        collector = BrowserEventCollector(driver=None, name="unit")
+        collector.start_test()
+        collector.handle(event("ConsoleAPICalled", type_="log", args=[NS(value="hello")]))
+        mark = collector.mark()
+        collector.handle(event("ConsoleAPICalled", type_="error", args=[NS(value="boom"), NS(value=42)]))
+        collector.handle(event("RequestWillBeSent", request_id="1", request=NS(url="https://www.guvi.in/a.js")))
+        collector.handle(event("LoadingFailed", request_id="1", error_text="net::ERR_FAILED", canceled=False))
+        collector.handle(event("ResponseReceived", request_id="2",
+                               response=NS(status=404, status_text="Not Found", url="https://www.guvi.in/x")))
+
+        assert [e["text"] for e in collector.errors()] == ["boom 42"]
+        network = collector.events(kinds=["network"])
+        assert [e["url"] for e in network] == ["https://www.guvi.in/a.js", "https://www.guvi.in/x"]
+        try:
+            collector.assert_no_new_console_errors(since=mark)
+            raise RuntimeError("expected an AssertionError")
+        except AssertionError as e:
+            assert "boom 42" in str(e)
+
+        assert len(collector.finish_test()) == 3
+        collector.start_test()
+        collector.assert_no_new_console_errors()
+
+    def test_session_attaches_to_the_tab_under_test(self, monkeypatch):
+        import trio
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace as NS
+        from selenium.webdriver.common.bidi import cdp
+        from utilities import devtools as devtools_module
+        from utilities.browser_events import BrowserEventCollector
+
+        targets = [NS(target_id="SW", type_="service_worker"), NS(target_id="DOBBY", type_="iframe"),
+                   NS(target_id="OTHER", type_="page"), NS(target_id="TAB", type_="page")]
+        assert devtools_module.choose_target(targets, "TAB").target_id == "TAB"
+        assert devtools_module.choose_target(targets, "GONE").target_id == "OTHER"
+        assert devtools_module.choose_target(targets[:2]) is None
+
+        attached = []
+
+        class _Connection:
+            async def execute(self, command):
+                return targets
+
+            @asynccontextmanager
+            async def open_session(self, target_id):
+                attached.append(target_id)
+                yield NS()
+
+        @asynccontextmanager
+        async def open_cdp(ws_url):
+            yield _Connection()
+
+        monkeypatch.setattr(cdp, "open_cdp", open_cdp)
+        monkeypatch.setattr(cdp, "import_devtools", lambda version: NS(target=NS(get_targets=lambda: None)))
+        driver = NS(caps={"se:cdp": "ws://localhost/devtools", "se:cdpVersion": "119.0"},
+                    current_window_handle="TAB")
+
+        async def attach():
+            async with devtools_module.page_session(driver, devtools_module.page_target_id(driver)) as conn:
+                return conn.target.target_id
+
+        assert trio.run(attach) == "TAB" and attached == ["TAB"]
+
+        collector = BrowserEventCollector(driver, name="unit")
+        monkeypatch.setattr(collector, "_run", lambda: collector._ready.set())
+        collector.start(timeout=1)
+        assert collector._target_id == "TAB"
@@ -1,12 +1,18 @@
 import pytest
+import itertools
+import os
 from utilities.config import Config
+from utilities.data_provider import stream_cases, matrix, shard, Throughput
 from pages.base_page import BasePage
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from pages.register_page import RegisterPage
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages.locators import By
+from utilities.lazy_import import LazyModule
+
+# Imported on first use so test collection does not load selenium.webdriver
+ui = LazyModule("selenium.webdriver.support.ui")
+EC = LazyModule("selenium.webdriver.support.expected_conditions")
 
 @pytest.mark.usefixtures("driver_init")
 class TestGUVI:
@@ -119,7 +125,7 @@ class TestGUVI:
         login_page.click_profile_icon()
         
         # Wait for dropdown to fully expand
-        wait = WebDriverWait(self.driver, 20)
+        wait = ui.WebDriverWait(self.driver, 20)
         
         try:
             # More robust logout button identification
@@ -192,7 +198,7 @@ class TestGUVI:
         login_page.click_profile_icon()
         
         # Wait for dropdown to fully expand
-        wait = WebDriverWait(self.driver, 20)
+        wait = ui.WebDriverWait(self.driver, 20)
         
         try:
             # More robust logout button identification
@@ -216,4 +222,67 @@ class TestGUVI:
         except Exception as e:
             self.logger.error(f"Logout failed: {str(e)}")
             self.driver.save_screenshot("logout_failure.png")
-            raise
\ No newline at end of file
+            raise
+
+
+@pytest.mark.usefixtures("driver_init")
+class TestLoginDataDriven:
+    """
+    Data-driven invalid credential and form validation cases.
+    Cases are streamed lazily from Config.INVALID_CREDENTIALS_FILE plus the
+    Config.MATRIX_* combinations and split into Config.DATA_SHARDS test items
+    by a stable hash, so xdist workers receive deterministic, disjoint shards.
+    Each shard warms one login page and resets the form between cases.
+    """
+
+    @staticmethod
+    def _cases():
+        """All cases, generated lazily (file rows first, then the matrix)."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return itertools.chain(
+            stream_cases(os.path.join(root, Config.INVALID_CREDENTIALS_FILE)),
+            matrix(email=Config.MATRIX_EMAILS, password=Config.MATRIX_PASSWORDS),
+        )
+
+    @pytest.mark.parametrize("shard_index", range(Config.DATA_SHARDS), ids=lambda i: f"shard{i}")
+    def test_invalid_login_cases(self, shard_index, record_property):
+        """
+        For every case in this shard:
+        1. Reset the form and submit the credentials
+        2. Verify the user is not logged in (still on the sign-in page)
+        3. If the case lists expected messages, verify one is shown
+        """
+        self.logger.info(f"Executing data-driven invalid login cases, shard {shard_index}")
+        home_page = HomePage(self.driver)
+        home_page.click_login()
+        login_page = LoginPage(self.driver)
+
+        throughput = Throughput()
+        failures = []
+        for case in shard(self._cases(), shard_index, Config.DATA_SHARDS):
+            login_page.reset_form()
+            login_page.login(case["email"], case["password"])
+
+            problem = None
+            if Config.LOGIN_URL not in self.driver.current_url:
+                problem = f"left the sign-in page ({self.driver.current_url})"
+            elif case.get("expected"):
+                expected = [e.lower() for e in case["expected"].split("|")]
+                if not login_page.wait_for_error_message():
+                    problem = "no error message shown"
+                elif not any(e in login_page.get_error_message().lower() for e in expected):
+                    problem = f"error message does not mention any of {expected}"
+
+            throughput.record(passed=problem is None)
+            if problem:
+                self.logger.error(f"Case {case['case_id']} failed: {problem}")
+                failures.append(f"{case['case_id']}: {problem}")
+                if Config.LOGIN_URL not in self.driver.current_url:
+                    # Get back to a usable login page for the remaining cases
+                    home_page = HomePage(self.driver)
+                    home_page.click_login()
+
+        record_property("cases", throughput.cases)
+        record_property("cases_per_second", throughput.cases_per_second)
+        self.logger.info(f"Shard {shard_index}: {throughput}")
+        assert not failures, f"{len(failures)} of {throughput.cases} case(s) failed: {failures[:10]}"
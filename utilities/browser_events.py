@@ -0,0 +1,216 @@
+# utilities/browser_events.py
+import threading
+import time
+from collections import OrderedDict
+from utilities.devtools import page_session, page_target_id
+from utilities.logger import setup_logger
+
+# Request URLs remembered to label failed requests (bounded, oldest dropped first)
+MAX_TRACKED_REQUESTS = 2000
+# Events kept per test; older ones are dropped and counted
+MAX_EVENTS_PER_TEST = 500
+
+ERROR_KINDS = ("console", "exception")
+
+
+def _remote_object_text(obj):
+    """Readable text of a CDP RemoteObject (console.error argument)."""
+    value = getattr(obj, "value", None)
+    if value is not None:
+        return str(value)
+    return getattr(obj, "description", None) or getattr(obj, "type_", "") or ""
+
+
+class BrowserEventCollector:
+    """
+    Event-driven collection of browser errors over a CDP (DevTools) connection:
+    - console.error / console.assert calls and browser log errors
+    - uncaught JS exceptions
+    - failed network requests (load failures and HTTP status >= 400)
+
+    Events are pushed by the browser and handled on a background thread, so
+    page object calls never wait on it. Events are appended to the buffer of
+    the test that is currently running (see start_test/finish_test).
+    """
+
+    def __init__(self, driver, name="browser"):
+        """
+        Args:
+            driver: Chromium-based Selenium WebDriver instance.
+            name: Session name used in log messages.
+        """
+        self.driver = driver
+        self.name = name
+        self.logger = setup_logger("BrowserEvents")
+        self.available = False
+        self._buffer = []
+        self._dropped = 0
+        self._requests = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread = None
+        self._target_id = None
+
+    # ----- Test buffers -------------------------------------------------
+
+    def start_test(self):
+        """Begin a new per-test buffer."""
+        with self._lock:
+            self._buffer = []
+            self._dropped = 0
+
+    def finish_test(self):
+        """
+        Close the current test's buffer.
+        Returns:
+            list: Events collected since start_test().
+        """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+            if self._dropped:
+                events.append({"kind": "dropped", "text": f"{self._dropped} more event(s) not kept"})
+            self._dropped = 0
+        return events
+
+    def mark(self):
+        """Position in the current test's buffer, for errors(since=...)."""
+        with self._lock:
+            return len(self._buffer)
+
+    def events(self, since=0, kinds=None):
+        """
+        Events of the current test.
+        Args:
+            since: Value returned by mark() (default: start of the test).
+            kinds: Optional iterable of kinds to keep ("console", "exception", "network").
+        """
+        with self._lock:
+            events = self._buffer[since:]
+        return [e for e in events if kinds is None or e["kind"] in kinds]
+
+    def errors(self, since=0):
+        """Console errors and uncaught exceptions of the current test."""
+        return self.events(since, ERROR_KINDS)
+
+    def assert_no_new_console_errors(self, since=0):
+        """
+        Assert no console errors or uncaught exceptions were reported since a mark.
+        Only inspects the in-memory buffer, so it costs no browser round trip.
+        Args:
+            since: Value returned by mark() (default: start of the test).
+        Raises:
+            AssertionError: Listing the new errors.
+        """
+        errors = self.errors(since)
+        assert not errors, f"{len(errors)} new browser error(s): " + "; ".join(e["text"] for e in errors[:5])
+
+    # ----- Event handling -------------------------------------------------
+
+    def _add(self, kind, level, text, url=None):
+        event = {"kind": kind, "level": level, "text": text, "url": url, "time": time.strftime("%H:%M:%S")}
+        with self._lock:
+            if len(self._buffer) < MAX_EVENTS_PER_TEST:
+                self._buffer.append(event)
+            else:
+                self._dropped += 1
+
+    def handle(self, event):
+        """
+        Translate one CDP event into a buffered record.
+        Dispatches on the event class name so it works with any devtools version.
+        """
+        kind = type(event).__name__
+        if kind == "ConsoleAPICalled":
+            if event.type_ in ("error", "assert"):
+                self._add("console", "error", " ".join(_remote_object_text(a) for a in event.args or []))
+        elif kind == "ExceptionThrown":
+            details = event.exception_details
+            exception = getattr(details, "exception", None)
+            text = getattr(exception, "description", None) or details.text
+            self._add("exception", "error", text, getattr(details, "url", None))
+        elif kind == "EntryAdded":
+            entry = event.entry
+            if entry.level == "error" and entry.source != "console-api":  # console-api is ConsoleAPICalled
+                self._add("console", "error", entry.text, getattr(entry, "url", None))
+        elif kind == "RequestWillBeSent":
+            self._requests[event.request_id] = event.request.url
+            while len(self._requests) > MAX_TRACKED_REQUESTS:
+                self._requests.popitem(last=False)
+        elif kind == "ResponseReceived":
+            self._requests.pop(event.request_id, None)
+            if event.response.status >= 400:
+                self._add("network", "error", f"HTTP {event.response.status} {event.response.status_text}",
+                          event.response.url)
+        elif kind == "LoadingFinished":
+            self._requests.pop(event.request_id, None)
+        elif kind == "LoadingFailed":
+            url = self._requests.pop(event.request_id, None)
+            if not event.canceled:
+                self._add("network", "error", f"Request failed: {event.error_text}", url)
+
+    # ----- CDP listener thread ---------------------------------------------
+
+    async def _listen(self):
+        import trio
+
+        async with page_session(self.driver, self._target_id) as connection:
+            session, devtools = connection.session, connection.devtools
+            await session.execute(devtools.runtime.enable())
+            await session.execute(devtools.network.enable())
+            await session.execute(devtools.log.enable())
+            listener = session.listen(
+                devtools.runtime.ConsoleAPICalled, devtools.runtime.ExceptionThrown, devtools.log.EntryAdded,
+                devtools.network.RequestWillBeSent, devtools.network.ResponseReceived,
+                devtools.network.LoadingFinished, devtools.network.LoadingFailed,
+                buffer_size=1000,
+            )
+            self.available = True
+            self._ready.set()
+
+            async def watch_stop(cancel_scope):
+                while not self._stop.is_set():
+                    await trio.sleep(0.2)
+                cancel_scope.cancel()
+
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(watch_stop, nursery.cancel_scope)
+                async for event in listener:
+                    try:
+                        self.handle(event)
+                    except Exception as e:
+                        self.logger.debug(f"Ignoring unparsable event {type(event).__name__}: {str(e)}")
+
+    def _run(self):
+        try:
+            import trio
+
+            trio.run(self._listen)
+        except Exception as e:
+            if not self._stop.is_set():
+                self.logger.warning(f"Browser event collection unavailable for {self.name}: {str(e)}")
+        finally:
+            self._ready.set()
+
+    def start(self, timeout=10):
+        """
+        Connect to the browser's DevTools endpoint and start listening to the
+        driver's current tab.
+        Args:
+            timeout: Seconds to wait for the subscription to be active.
+        Returns:
+            bool: True if events are being collected.
+        """
+        self._target_id = page_target_id(self.driver)  # Read here: the driver is not thread-safe
+        self._thread = threading.Thread(target=self._run, name=f"events-{self.name}", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        if self.available:
+            self.logger.info(f"Collecting console, exception and network errors for {self.name}")
+        return self.available
+
+    def stop(self):
+        """Unsubscribe and stop the listener thread (call before driver.quit())."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5)
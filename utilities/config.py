@@ -24,10 +24,26 @@ class Config:
     INVALID_EMAIL = "invalid@example.com"  # Generic invalid email format
     INVALID_PASSWORD = "wrongpassword"  # Generic invalid password
 
+    # Data-Driven Login Cases (streamed lazily, see utilities/data_provider.py)
+    INVALID_CREDENTIALS_FILE = "test_data/invalid_credentials.csv"  # CSV or JSONL case file
+    MATRIX_EMAILS = ["invalid@example.com", "no-such-user@guvi.in", "user@@example.com", "plainaddress", ""]
+    MATRIX_PASSWORDS = ["wrongpassword", "12345", " ", ""]
+    DATA_SHARDS = 4  # Cases are split into this many test items (spread over xdist workers)
+
     # Wait Time Configurations (in seconds)
     IMPLICIT_WAIT = 10  # Global implicit wait time for element presence
     EXPLICIT_WAIT = 20  # Maximum explicit wait time for element interactions
 
+    # Browser Resource Watchdog (recycles long-lived sessions between tests)
+    WATCHDOG_ENABLED = True  # Sample JS heap, DOM nodes and RSS of each browser session
+    WATCHDOG_INTERVAL = 5  # Seconds between samples
+    WATCHDOG_MAX_JS_HEAP_MB = 512  # Recycle once the JS heap exceeds this size
+    WATCHDOG_MAX_DOM_NODES = 150000  # Recycle once the DOM node count exceeds this
+    WATCHDOG_MAX_RSS_MB = 3072  # Recycle once the browser process tree RSS exceeds this
+
+    # Browser Event Collection (console errors, uncaught exceptions, failed requests via CDP)
+    BROWSER_EVENTS_ENABLED = True
+
     # Security Configuration
     CREDENTIAL_MASKING = True  # When True, prevents logging of sensitive credentials
 
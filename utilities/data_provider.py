@@ -0,0 +1,100 @@
+# utilities/data_provider.py
+import csv
+import itertools
+import json
+import os
+import time
+import zlib
+
+
+def stream_cases(path):
+    """
+    Lazily read test cases from a CSV (header row) or JSONL file.
+    Rows are yielded one at a time, so files of any size can be used.
+    Args:
+        path: .csv, .jsonl or .ndjson file.
+    Yields:
+        dict: One case, with a stable "case_id" (the "id" column if present,
+              otherwise "<file name>:<line number>").
+    """
+    name = os.path.basename(path)
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as fh:
+        if extension == ".csv":
+            reader = csv.DictReader(fh)
+            rows = ((reader.line_num, row) for row in reader)
+        elif extension in (".jsonl", ".ndjson"):
+            rows = ((number, json.loads(line)) for number, line in enumerate(fh, 1) if line.strip())
+        else:
+            raise ValueError(f"Unsupported case file type: {path}")
+        for line_number, case in rows:
+            case.setdefault("case_id", case.get("id") or f"{name}:{line_number}")
+            yield case
+
+
+def matrix(**axes):
+    """
+    Combinatorial matrix of cases, generated lazily (never materialised).
+    Example:
+        matrix(email=["a@x.com", "bad"], password=["", "short"])  # 4 cases
+    Args:
+        **axes: Axis name -> iterable of values (each axis is read once).
+    Yields:
+        dict: One combination, with a "case_id" built from its values.
+    """
+    names = list(axes)
+    for values in itertools.product(*(list(axes[n]) for n in names)):
+        case = dict(zip(names, values))
+        case["case_id"] = "matrix:" + "|".join(f"{n}={v}" for n, v in case.items())
+        yield case
+
+
+def matrix_size(**axes):
+    """Number of cases matrix(**axes) would produce, without generating them."""
+    size = 1
+    for values in axes.values():
+        size *= len(values)
+    return size
+
+
+def shard_of(case_id, shard_count):
+    """Deterministic shard for a case id (stable across runs, machines and workers)."""
+    return zlib.crc32(str(case_id).encode("utf-8")) % shard_count
+
+
+def shard(cases, shard_index, shard_count):
+    """
+    Lazily keep only the cases belonging to one shard.
+    Args:
+        cases: Iterable of case dicts with "case_id".
+        shard_index: Shard to keep (0-based).
+        shard_count: Total number of shards.
+    """
+    return (case for case in cases if shard_of(case["case_id"], shard_count) == shard_index)
+
+
+class Throughput:
+    """Counts processed cases and reports cases per second."""
+
+    def __init__(self):
+        self.cases = 0
+        self.failures = 0
+        self._started = time.perf_counter()
+
+    def record(self, passed=True):
+        self.cases += 1
+        if not passed:
+            self.failures += 1
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._started
+
+    @property
+    def cases_per_second(self):
+        elapsed = self.elapsed
+        return round(self.cases / elapsed, 2) if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (f"{self.cases} case(s), {self.failures} failure(s) in {self.elapsed:.1f}s "
+                f"({self.cases_per_second} cases/s)")
@@ -0,0 +1,75 @@
+# utilities/devtools.py
+from collections import namedtuple
+from contextlib import asynccontextmanager
+
+# An open CDP session on the tab under test
+PageConnection = namedtuple("PageConnection", "session devtools target")
+
+
+def page_target_id(driver):
+    """
+    CDP target id of the driver's current tab.
+    In Chromium the window handle is the tab's target id. Call this on the
+    thread driving the browser, before handing work to a background thread.
+    Returns:
+        str: Target id, or None if it cannot be read.
+    """
+    try:
+        return driver.current_window_handle
+    except Exception:
+        return None
+
+
+def choose_target(targets, target_id=None):
+    """
+    Pick the tab under test from Target.getTargets.
+    CDP returns targets in no particular order, and service workers and
+    out-of-process iframes (e.g. chat widgets) are targets too.
+    Args:
+        targets: TargetInfo objects.
+        target_id: Target id of the tab under test, if known.
+    Returns:
+        TargetInfo: The target with that id, else the first "page" target, else None.
+    """
+    pages = [target for target in targets if target.type_ == "page"]
+    if target_id:
+        for target in pages:
+            if str(target.target_id) == str(target_id):
+                return target
+    return pages[0] if pages else None
+
+
+@asynccontextmanager
+async def page_session(driver, target_id=None):
+    """
+    Open a dedicated CDP connection attached to the tab under test.
+    Unlike driver.bidi_connection(), which attaches to whichever target is
+    listed first, this attaches to target_id (see page_target_id) or a page.
+    Nothing is sent through the WebDriver, so it is safe to use from a
+    background thread while a test drives the browser.
+    Args:
+        driver: Chromium-based Selenium WebDriver instance.
+        target_id: Target id of the tab under test (default: first page target).
+    Yields:
+        PageConnection: session, devtools module and the chosen target.
+    Raises:
+        RuntimeError: If the browser exposes no CDP endpoint or no page target.
+    """
+    from selenium.webdriver.common.bidi import cdp
+
+    if driver.caps.get("se:cdp"):
+        ws_url = driver.caps.get("se:cdp")
+        version = driver.caps.get("se:cdpVersion").split(".")[0]
+    else:
+        version, ws_url = driver._get_cdp_details()
+    if not ws_url:
+        raise RuntimeError("Browser exposes no DevTools endpoint")
+
+    devtools = cdp.import_devtools(version)
+    async with cdp.open_cdp(ws_url) as connection:
+        targets = await connection.execute(devtools.target.get_targets())
+        target = choose_target(targets, target_id)
+        if target is None:
+            raise RuntimeError("No page target to attach to")
+        async with connection.open_session(target.target_id) as session:
+            yield PageConnection(session, devtools, target)
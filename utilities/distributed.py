@@ -0,0 +1,383 @@
+# utilities/distributed.py
+"""
+Multi-node test distribution with a work-stealing queue.
+
+A coordinator process holds the queue of test node ids. Agent processes
+(on this or other hosts) connect over TCP, pull tests one at a time, run
+them in their own pytest session (so each agent owns its browsers), and
+stream results back. The coordinator merges everything into one report.
+
+Scheduling:
+- Tests are grouped by test class, so class-scoped fixtures (the browser
+  from driver_init) are reused on one agent.
+- An agent with nothing left takes the next group from the shared queue.
+- When the shared queue is empty, it steals half of the not-yet-started
+  tests of the peer with the largest backlog (the slowest one).
+
+Usage:
+    python -m utilities.distributed coordinator --port 8765 [-- <pytest args>]
+    python -m utilities.distributed agent --host <coordinator> --port 8765 --count 2 [-- <pytest args>]
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from utilities.logger import setup_logger
+
+DEFAULT_PORT = 8765
+REPORT_FILE = "distributed_report.json"
+
+
+def _send(stream, message):
+    """Write one newline-delimited JSON message."""
+    stream.write((json.dumps(message) + "\n").encode("utf-8"))
+    stream.flush()
+
+
+def _recv(stream):
+    """Read one newline-delimited JSON message, or None on disconnect."""
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line.decode("utf-8"))
+
+
+def _group_key(nodeid):
+    """Tests of the same class (or module) share a group."""
+    return nodeid.rsplit("::", 1)[0]
+
+
+def collect_nodeids(pytest_args=()):
+    """
+    Collect test node ids with `pytest --co -q`.
+    Args:
+        pytest_args: Extra pytest arguments (paths, -k, -m, ...).
+    Returns:
+        list: Node ids in collection order.
+    """
+    proc = subprocess.run([sys.executable, "-m", "pytest", "--co", "-q", *pytest_args],
+                          capture_output=True, text=True)
+    nodeids = [line.strip() for line in proc.stdout.splitlines() if "::" in line]
+    if proc.returncode not in (0, 5) and not nodeids:  # 5 = no tests collected
+        raise RuntimeError(f"Test collection failed:\n{proc.stdout}\n{proc.stderr}")
+    return nodeids
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    """Threaded TCP server that can rebind a port left in TIME_WAIT by a previous run."""
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class Coordinator:
+    """
+    Holds the test queue, schedules work to agents and merges results.
+    """
+
+    def __init__(self, nodeids, host="0.0.0.0", port=DEFAULT_PORT):
+        """
+        Args:
+            nodeids: Test node ids to distribute.
+            host: Interface to listen on.
+            port: TCP port (0 picks a free port).
+        """
+        self.logger = setup_logger("Coordinator")
+        self.nodeids = list(nodeids)
+        self.results = {}
+        self.steals = 0
+        self.started_at = None
+
+        groups = {}
+        for nodeid in self.nodeids:
+            groups.setdefault(_group_key(nodeid), []).append(nodeid)
+        self._queue = deque(groups.values())  # Shared queue of groups
+        self._local = {}                       # agent -> deque of assigned, not started tests
+        self._in_flight = {}                   # agent -> set of started tests
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        if not self.nodeids:
+            self._done.set()
+
+        coordinator = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                coordinator._serve_agent(self.rfile, self.wfile)
+
+        self._server = _Server((host, port), _Handler)
+        self.address = self._server.server_address
+
+    def start(self):
+        """Start accepting agents in a background thread."""
+        self.started_at = time.time()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.logger.info(f"Coordinator listening on {self.address[0]}:{self.address[1]} "
+                         f"with {len(self.nodeids)} test(s)")
+
+    def wait(self, timeout=None):
+        """
+        Block until every test has a result.
+        Returns:
+            bool: True if all tests finished, False on timeout.
+        """
+        finished = self._done.wait(timeout)
+        self._server.shutdown()
+        self._server.server_close()
+        return finished
+
+    def _next_for(self, agent):
+        """Pick the next test for an agent (own backlog, shared queue, then steal)."""
+        with self._lock:
+            local = self._local.setdefault(agent, deque())
+            if not local and self._queue:
+                local.extend(self._queue.popleft())
+            if not local:
+                victim = max(self._local, key=lambda name: len(self._local[name]))
+                backlog = self._local[victim]
+                if backlog:
+                    count = max(1, len(backlog) // 2)
+                    stolen = [backlog.pop() for _ in range(count)]
+                    local.extend(reversed(stolen))
+                    self.steals += 1
+                    self.logger.info(f"{agent} stole {count} test(s) from {victim}")
+            if not local:
+                return None
+            nodeid = local.popleft()
+            self._in_flight.setdefault(agent, set()).add(nodeid)
+            return nodeid
+
+    def _record(self, agent, result):
+        """Store one merged test result."""
+        with self._lock:
+            nodeid = result["nodeid"]
+            self._in_flight.get(agent, set()).discard(nodeid)
+            result["agent"] = agent
+            self.results[nodeid] = result
+            if len(self.results) >= len(self.nodeids):
+                self._done.set()
+
+    def _release(self, agent):
+        """Requeue the backlog of a disconnected agent and fail its running tests."""
+        with self._lock:
+            backlog = self._local.pop(agent, deque())
+            if backlog:
+                self._queue.appendleft(list(backlog))
+            lost = self._in_flight.pop(agent, set())
+        for nodeid in lost:
+            if nodeid not in self.results:
+                self.logger.error(f"Agent {agent} disconnected while running {nodeid}")
+                self._record(agent, {"nodeid": nodeid, "outcome": "error", "duration": 0.0,
+                                     "longrepr": f"agent {agent} disconnected"})
+
+    def _serve_agent(self, rfile, wfile):
+        """Conversation with one agent connection."""
+        hello = _recv(rfile)
+        if not hello or hello.get("op") != "hello":
+            return
+        agent = hello["agent"]
+        self.logger.info(f"Agent connected: {agent}")
+        try:
+            while True:
+                message = _recv(rfile)
+                if message is None or message["op"] == "bye":
+                    break
+                if message["op"] == "next":
+                    nodeid = self._next_for(agent)
+                    _send(wfile, {"op": "run", "nodeid": nodeid} if nodeid else {"op": "done"})
+                elif message["op"] == "result":
+                    self._record(agent, message["result"])
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Connection to agent {agent} failed: {str(e)}")
+        finally:
+            self._release(agent)
+            self.logger.info(f"Agent disconnected: {agent}")
+
+    def summary(self):
+        """Count results per outcome."""
+        counts = {}
+        for result in self.results.values():
+            counts[result["outcome"]] = counts.get(result["outcome"], 0) + 1
+        return counts
+
+    def write_report(self, path=REPORT_FILE):
+        """
+        Write the merged report of all agents as JSON.
+        Args:
+            path: Output file path.
+        """
+        ordered = [self.results[n] for n in self.nodeids if n in self.results]
+        report = {
+            "duration": round(time.time() - (self.started_at or time.time()), 3),
+            "summary": self.summary(),
+            "steals": self.steals,
+            "agents": sorted({r["agent"] for r in ordered}),
+            "tests": ordered,
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        self.logger.info(f"Merged report written to {path}")
+        return report
+
+
+class AgentClient:
+    """Connection from an agent to the coordinator."""
+
+    def __init__(self, host, port, name=None, retries=50):
+        """
+        Args:
+            host: Coordinator host.
+            port: Coordinator port.
+            name: Agent name (default: hostname-pid).
+            retries: Connection attempts, 0.1s apart (coordinator may still be starting).
+        """
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        for attempt in range(retries):
+            try:
+                self._sock = socket.create_connection((host, port))
+                break
+            except OSError:
+                if attempt == retries - 1:
+                    raise
+                time.sleep(0.1)
+        self._rfile = self._sock.makefile("rb")
+        self._wfile = self._sock.makefile("wb")
+        _send(self._wfile, {"op": "hello", "agent": self.name})
+
+    def next(self):
+        """Ask for the next test. Returns a node id, or None when no work is left."""
+        _send(self._wfile, {"op": "next"})
+        reply = _recv(self._rfile)
+        if not reply or reply.get("op") != "run":
+            return None
+        return reply["nodeid"]
+
+    def report(self, result):
+        """Stream one test result to the coordinator."""
+        _send(self._wfile, {"op": "result", "result": result})
+
+    def close(self):
+        """Say goodbye and close the connection."""
+        try:
+            _send(self._wfile, {"op": "bye"})
+        except OSError:
+            pass
+        self._sock.close()
+
+
+class AgentPlugin:
+    """
+    Pytest plugin that replaces the normal run loop with work pulled from
+    the coordinator. One test is held back until the next one is known so
+    class-scoped fixtures (the browser) are only torn down when needed.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._reports = {}
+
+    def pytest_runtest_logreport(self, report):
+        self._reports.setdefault(report.nodeid, []).append(report)
+
+    def _run(self, item, nextitem):
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        reports = self._reports.pop(item.nodeid, [])
+        outcome = "passed"
+        longrepr = None
+        for report in reports:
+            if report.failed:
+                outcome = "failed" if report.when == "call" else "error"
+                longrepr = str(report.longrepr)
+                break
+            if report.skipped:
+                outcome = "skipped"
+                longrepr = str(report.longrepr)
+        self.client.report({
+            "nodeid": item.nodeid,
+            "outcome": outcome,
+            "duration": round(sum(r.duration for r in reports), 3),
+            "longrepr": longrepr,
+        })
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        items = {item.nodeid: item for item in session.items}
+        pending = None
+        while True:
+            nodeid = self.client.next()
+            if nodeid is None:
+                break
+            item = items.get(nodeid)
+            if item is None:
+                self.client.report({"nodeid": nodeid, "outcome": "error", "duration": 0.0,
+                                    "longrepr": "test not collected on agent"})
+                continue
+            if pending is not None:
+                self._run(pending, item)
+            pending = item
+        if pending is not None:
+            self._run(pending, None)
+        self.client.close()
+        return True
+
+
+def run_agent(host, port, pytest_args=(), name=None):
+    """
+    Run one agent: collect locally, then execute tests handed out by the coordinator.
+    Returns:
+        int: pytest exit code.
+    """
+    client = AgentClient(host, port, name=name)
+    return pytest.main(list(pytest_args), plugins=[AgentPlugin(client)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed test coordinator/agent")
+    sub = parser.add_subparsers(dest="role", required=True)
+
+    coordinator = sub.add_parser("coordinator", help="Serve the test queue and merge results")
+    coordinator.add_argument("--host", default="0.0.0.0")
+    coordinator.add_argument("--port", type=int, default=DEFAULT_PORT)
+    coordinator.add_argument("--report", default=REPORT_FILE, help="Merged report path")
+    coordinator.add_argument("--timeout", type=float, default=None, help="Give up after N seconds")
+
+    agent = sub.add_parser("agent", help="Pull and run tests from a coordinator")
+    agent.add_argument("--host", default="127.0.0.1")
+    agent.add_argument("--port", type=int, default=DEFAULT_PORT)
+    agent.add_argument("--count", type=int, default=1, help="Agent processes to start on this host")
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    pytest_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, pytest_args = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    if args.role == "coordinator":
+        server = Coordinator(collect_nodeids(pytest_args), args.host, args.port)
+        server.start()
+        finished = server.wait(args.timeout)
+        report = server.write_report(args.report)
+        print(f"{report['summary']} across agents {report['agents']} "
+              f"({report['steals']} steal(s), {report['duration']}s)")
+        return 0 if finished and set(report["summary"]) <= {"passed", "skipped"} else 1
+
+    if args.count == 1:
+        return run_agent(args.host, args.port, pytest_args)
+    # Several agents on this host: one process (and browser pool) each
+    procs = [subprocess.Popen([sys.executable, "-m", "utilities.distributed", "agent",
+                               "--host", args.host, "--port", str(args.port), "--", *pytest_args])
+             for _ in range(args.count)]
+    return max(proc.wait() for proc in procs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
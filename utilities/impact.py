@@ -0,0 +1,529 @@
+# utilities/impact.py
+import ast
+import hashlib
+import inspect
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+# Default location of the impact index (relative to the pytest rootdir)
+INDEX_FILE = ".impact_index.json"
+INDEX_VERSION = 1
+
+# Files that every test implicitly depends on. Any change to them makes the
+# selection fall back to the full suite.
+GLOBAL_FILES = ("tests/conftest.py", "requirements.txt")
+GLOBAL_DIRS = ("utilities",)
+# Test data directories: every file in them is global (data-driven tests read them at run time)
+DATA_DIRS = ("test_data",)
+
+PAGES_DIR = "pages"
+
+
+def _fingerprint(node):
+    """
+    Fingerprint an AST node.
+    Comments and formatting do not change the fingerprint, only code does.
+    Args:
+        node: ast.AST node (or a list of nodes).
+    Returns:
+        str: Short sha1 hex digest.
+    """
+    if isinstance(node, list):
+        dumped = "\n".join(ast.dump(n) for n in node)
+    else:
+        dumped = ast.dump(node)
+    return hashlib.sha1(dumped.encode("utf-8")).hexdigest()[:16]
+
+
+def _file_fingerprint(path):
+    """Fingerprint the raw bytes of a file, or None if it does not exist."""
+    try:
+        with open(path, "rb") as fh:
+            return hashlib.sha1(fh.read()).hexdigest()[:16]
+    except OSError:
+        return None
+
+
+def _is_locator_name(name):
+    """Locator constants follow the UPPER_CASE naming convention."""
+    return name.isupper() and not name.startswith("_")
+
+
+def _module_name(root, path):
+    """Convert a file path under root into a dotted module name."""
+    rel = os.path.relpath(path, root)
+    return os.path.splitext(rel)[0].replace(os.sep, ".")
+
+
+class PageModel:
+    """
+    Static model of the page object modules.
+
+    Every page module is split into fine-grained units, each with its own
+    fingerprint:
+    - "pages.home_page": module-level code (imports, helpers)
+    - "HomePage": class header and class-level statements
+    - "HomePage.LOGIN_BUTTON": a locator constant
+    - "HomePage.click_login": a method
+
+    For every method the model also knows which locator constants it
+    references, so a recorded method call can be expanded into the
+    locators the test depends on.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.units = {}            # unit -> fingerprint
+        self.method_locators = {}  # "Class.method" -> set of "Class.CONST"
+        self.class_module = {}     # "Class" -> "pages.module"
+        self._bases = {}           # "Class" -> [base class names]
+        self._constants = {}       # "Class" -> set of constant names
+        self._aliases = {}         # "Class" -> {attribute: constant name}
+        self._pending = []         # (class, method, [referenced names])
+
+        pages_dir = os.path.join(root, PAGES_DIR)
+        if os.path.isdir(pages_dir):
+            for filename in sorted(os.listdir(pages_dir)):
+                if filename.endswith(".py"):
+                    self._scan_module(os.path.join(pages_dir, filename))
+        self._resolve()
+
+    def _scan_module(self, path):
+        """Split one page module into units."""
+        with open(path, "r", encoding="utf-8") as fh:
+            tree = ast.parse(fh.read(), filename=path)
+        module = _module_name(self.root, path)
+
+        module_level = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self._scan_class(module, node)
+            else:
+                module_level.append(node)
+        self.units[module] = _fingerprint(module_level)
+
+    def _scan_class(self, module, node):
+        """Split one page class into locator, method and header units."""
+        name = node.name
+        self.class_module[name] = module
+        self._bases[name] = [b.id for b in node.bases if isinstance(b, ast.Name)]
+        self._constants[name] = set()
+        self._aliases[name] = {}
+
+        header = [ast.dump(b) for b in node.bases] + [ast.dump(d) for d in node.decorator_list]
+        for stmt in node.body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.units[f"{name}.{stmt.name}"] = _fingerprint(stmt)
+                self._pending.append((name, stmt.name, _referenced_attributes(stmt)))
+                continue
+
+            targets = _assigned_names(stmt)
+            locators = [t for t in targets if _is_locator_name(t)]
+            if locators:
+                for target in locators:
+                    self._constants[name].add(target)
+                    self.units[f"{name}.{target}"] = _fingerprint(stmt)
+                continue
+
+            # Attributes built from a locator (e.g. lazy element descriptors)
+            # are treated as aliases of that locator
+            alias = _locator_alias(stmt)
+            if alias is not None:
+                self._aliases[name][alias[0]] = alias[1]
+            header.append(ast.dump(stmt))
+
+        self.units[name] = hashlib.sha1("\n".join(header).encode("utf-8")).hexdigest()[:16]
+
+    def _mro(self, name):
+        """Page classes visited when resolving an attribute on `name`."""
+        order, queue = [], [name]
+        while queue:
+            current = queue.pop(0)
+            if current in self._constants and current not in order:
+                order.append(current)
+                queue.extend(self._bases.get(current, []))
+        return order
+
+    def resolve_locator(self, cls_name, attr):
+        """
+        Resolve an attribute referenced on a page class to its locator unit.
+        Args:
+            cls_name: Class the attribute is looked up on.
+            attr: Attribute name (constant or descriptor alias).
+        Returns:
+            str: Unit name like "HomePage.LOGIN_BUTTON", or None.
+        """
+        for owner in self._mro(cls_name):
+            if attr in self._constants[owner]:
+                return f"{owner}.{attr}"
+            if attr in self._aliases[owner]:
+                return self.resolve_locator(owner, self._aliases[owner][attr])
+        return None
+
+    def _resolve(self):
+        """Map every method to the locator constants it references."""
+        for cls_name, method, references in self._pending:
+            found = set()
+            for owner, attr in references:
+                lookup = cls_name if owner in ("self", "cls") else owner
+                if lookup not in self._constants:
+                    continue
+                unit = self.resolve_locator(lookup, attr)
+                if unit:
+                    found.add(unit)
+            self.method_locators[f"{cls_name}.{method}"] = found
+        self._pending = []
+
+    def expand(self, units):
+        """
+        Expand recorded method units with their locators, classes and modules.
+        Args:
+            units: Iterable of recorded unit names.
+        Returns:
+            set: Complete set of units the test depends on.
+        """
+        expanded = set()
+        for unit in units:
+            if unit not in self.units:
+                continue
+            expanded.add(unit)
+            expanded.update(self.method_locators.get(unit, ()))
+            cls_name = unit.split(".", 1)[0]
+            if cls_name in self.class_module:
+                expanded.add(cls_name)
+                expanded.add(self.class_module[cls_name])
+        return expanded
+
+    def locators_in(self, func_node):
+        """Locator units referenced directly as `PageClass.CONST` in a function."""
+        found = set()
+        for owner, attr in _referenced_attributes(func_node):
+            if owner in self._constants:
+                unit = self.resolve_locator(owner, attr)
+                if unit:
+                    found.add(unit)
+        return found
+
+
+def _assigned_names(stmt):
+    """Names bound by a class-level assignment statement."""
+    if isinstance(stmt, ast.Assign):
+        return [t.id for t in stmt.targets if isinstance(t, ast.Name)]
+    if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+        return [stmt.target.id]
+    return []
+
+
+def _locator_alias(stmt):
+    """Detect `name = Something(CONST)` and return (name, CONST)."""
+    if not isinstance(stmt, ast.Assign) or not isinstance(stmt.value, ast.Call):
+        return None
+    names = _assigned_names(stmt)
+    args = stmt.value.args
+    if len(names) == 1 and args and isinstance(args[0], ast.Name) and _is_locator_name(args[0].id):
+        return names[0], args[0].id
+    return None
+
+
+def _referenced_attributes(func_node):
+    """Collect (owner, attribute) pairs for every `Name.attr` in a function."""
+    refs = []
+    for node in ast.walk(func_node):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            refs.append((node.value.id, node.attr))
+    return refs
+
+
+def _function_node(func):
+    """Parse a Python function into its AST node, or None if unavailable."""
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+        return ast.parse(source).body[0]
+    except (OSError, TypeError, SyntaxError, IndexError):
+        return None
+
+
+def _test_module_fingerprint(path):
+    """Fingerprint a test module excluding the bodies of its test functions."""
+
+    class _StripTests(ast.NodeTransformer):
+        def visit_FunctionDef(self, node):
+            return None if node.name.startswith("test") else node
+
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            tree = ast.parse(fh.read(), filename=path)
+    except (OSError, SyntaxError):
+        return None
+    return _fingerprint(_StripTests().visit(tree))
+
+
+def global_fingerprints(root):
+    """
+    Fingerprint the support files every test depends on.
+    Args:
+        root: Project root directory.
+    Returns:
+        dict: Relative path -> fingerprint.
+    """
+    result = {}
+    for rel in GLOBAL_FILES:
+        result[rel] = _file_fingerprint(os.path.join(root, rel))
+    for rel_dir in GLOBAL_DIRS + (PAGES_DIR,):
+        directory = os.path.join(root, rel_dir)
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".py"):
+                continue
+            # Page modules are tracked per unit, only their package init is global
+            if rel_dir == PAGES_DIR and filename != "__init__.py":
+                continue
+            rel = f"{rel_dir}/{filename}"
+            result[rel] = _file_fingerprint(os.path.join(root, rel))
+    for rel_dir in DATA_DIRS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, rel_dir)):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                result[os.path.relpath(path, root).replace(os.sep, "/")] = _file_fingerprint(path)
+    return result
+
+
+def load_index(path):
+    """
+    Load the impact index.
+    Args:
+        path: Index file path.
+    Returns:
+        dict: Index contents, or None if missing or incompatible.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def select_tests(index, root, tests):
+    """
+    Decide which tests are affected by the changes since the index was recorded.
+    Args:
+        index: Loaded index dict (or None).
+        root: Project root directory.
+        tests: Dict of nodeid -> (test fingerprint, module unit, module fingerprint).
+    Returns:
+        tuple: (selected nodeids or None for the full suite, reason string)
+    """
+    if index is None:
+        return None, "no impact index found"
+
+    recorded_globals = index.get("global", {})
+    current_globals = global_fingerprints(root)
+    changed_globals = [
+        rel for rel in set(recorded_globals) | set(current_globals)
+        if recorded_globals.get(rel) != current_globals.get(rel)
+    ]
+    if changed_globals:
+        return None, f"support files changed: {', '.join(sorted(changed_globals))}"
+
+    current = dict(PageModel(root).units)
+    for _, module_unit, module_fp in tests.values():
+        current[module_unit] = module_fp
+
+    selected, changed = set(), set()
+    recorded = index.get("tests", {})
+    for nodeid, (test_fp, _, _) in tests.items():
+        entry = recorded.get(nodeid)
+        if entry is None or entry.get("fingerprint") != test_fp:
+            selected.add(nodeid)  # New or edited test
+            continue
+        stale = {unit for unit, fp in entry.get("units", {}).items() if current.get(unit) != fp}
+        if stale:
+            selected.add(nodeid)
+            changed.update(stale)
+    return selected, f"{len(changed)} changed unit(s)"
+
+
+class ImpactRecorder:
+    """
+    Records the page classes, methods and locators each test touches.
+    Method calls are captured with a profile hook that is only active while
+    a test runs, and only when recording is requested.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._code_units = {}
+        self._touched = set()
+
+    def _map_page_code(self):
+        """Map code objects of loaded page classes to their unit names."""
+        pages_dir = os.path.join(self.root, PAGES_DIR) + os.sep
+        for module in list(sys.modules.values()):
+            path = getattr(module, "__file__", None) or ""
+            if not os.path.abspath(path).startswith(pages_dir):
+                continue
+            for cls in vars(module).values():
+                if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                    continue
+                for attr, value in vars(cls).items():
+                    func = getattr(value, "__func__", None) or getattr(value, "fget", None) or value
+                    code = getattr(func, "__code__", None)
+                    if code is not None:
+                        self._code_units[code] = f"{cls.__name__}.{attr}"
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            unit = self._code_units.get(frame.f_code)
+            if unit is not None:
+                self._touched.add(unit)
+
+    def start(self):
+        """Begin capturing page method calls for one test."""
+        if not self._code_units:
+            self._map_page_code()
+        self._touched = set()
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        """Stop capturing and return the touched method units."""
+        sys.setprofile(None)
+        return set(self._touched)
+
+
+class ImpactPlugin:
+    """
+    Pytest plugin implementing test impact analysis.
+
+    --impact-record: record the dependencies of every executed test into the index
+    --impact-select: run only tests affected by changes since the last recording
+                     (falls back to the full suite when unsure); a run where
+                     no test is affected exits with status 0, not 5
+
+    Under pytest-xdist, workers send their recorded entries to the controller
+    (through workeroutput), which is the only process writing the index.
+    """
+
+    def __init__(self, config, record=False, select=False, index_path=None):
+        self.config = config
+        self.root = str(config.rootpath)
+        self.index_path = index_path or os.path.join(self.root, INDEX_FILE)
+        self.record = record
+        self.select = select
+        self.recorder = ImpactRecorder(self.root) if record else None
+        self.is_worker = hasattr(config, "workerinput")
+        self.results = {}
+        self.worker_entries = {}
+        self.workers_down = 0
+        self.workers_deselected_all = 0
+        self.deselected_all = False
+        self.message = None
+
+    def _test_fingerprints(self, item):
+        """Fingerprint the test function and its module-level code."""
+        node = _function_node(getattr(item, "function", None))
+        test_fp = _fingerprint(node) if node is not None else None
+        path = str(item.path)
+        module_unit = _module_name(self.root, path)
+        return test_fp, module_unit, _test_module_fingerprint(path)
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        if not self.select:
+            return
+        tests = {item.nodeid: self._test_fingerprints(item) for item in items}
+        selected, reason = select_tests(load_index(self.index_path), self.root, tests)
+        if selected is None:
+            self.message = f"impact: running full suite ({reason})"
+            return
+
+        keep = [item for item in items if item.nodeid in selected]
+        dropped = [item for item in items if item.nodeid not in selected]
+        if dropped:
+            config.hook.pytest_deselected(items=dropped)
+            items[:] = keep
+        self.deselected_all = bool(dropped) and not keep
+        self.message = f"impact: selected {len(keep)} of {len(keep) + len(dropped)} tests ({reason})"
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.recorder is None:
+            yield
+            return
+        self.recorder.start()
+        try:
+            yield
+        finally:
+            touched = self.recorder.stop()
+        self.results[item.nodeid] = (item, touched)
+
+    def _entries(self):
+        """Index entries (nodeid -> fingerprint and dependency units) of the tests run here."""
+        model = PageModel(self.root)
+        entries = {}
+        for nodeid, (item, touched) in self.results.items():
+            test_fp, module_unit, module_fp = self._test_fingerprints(item)
+            deps = model.expand(touched)
+            node = _function_node(getattr(item, "function", None))
+            if node is not None:
+                deps.update(model.expand(model.locators_in(node)))
+            units = {unit: model.units[unit] for unit in deps}
+            units[module_unit] = module_fp
+            entries[nodeid] = {"fingerprint": test_fp, "units": units}
+        return entries
+
+    def _write_index(self, entries):
+        """Merge entries into the index file."""
+        current_globals = global_fingerprints(self.root)
+        index = load_index(self.index_path)
+        if index is None or index.get("global") != current_globals:
+            # Entries recorded against other support files can no longer be trusted
+            index = {"version": INDEX_VERSION, "tests": {}}
+        index["tests"].update(entries)
+        index["global"] = current_globals
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self.message = f"impact: recorded {len(entries)} test(s) into {self.index_path}"
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """pytest-xdist controller: collect a finished worker's entries."""
+        output = getattr(node, "workeroutput", {})
+        self.worker_entries.update(output.get("impact_entries", {}))
+        self.workers_down += 1
+        self.workers_deselected_all += 1 if output.get("impact_deselected_all") else 0
+        self.message = self.message or output.get("impact_message")
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.is_worker:
+            output = self.config.workeroutput
+            output["impact_deselected_all"] = self.deselected_all
+            output["impact_message"] = self.message
+            if self.recorder is not None:
+                output["impact_entries"] = self._entries()
+            return
+
+        if self.workers_down and self.workers_deselected_all == self.workers_down:
+            self.deselected_all = True
+        if self.deselected_all and exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = pytest.ExitCode.OK  # Nothing affected is a successful gate
+
+        if self.recorder is not None:
+            entries = self._entries()
+            entries.update(self.worker_entries)
+            if entries:
+                self._write_index(entries)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.message:
+            terminalreporter.write_line(self.message)
@@ -0,0 +1,33 @@
+# utilities/lazy_import.py
+import importlib
+
+
+class LazyModule:
+    """
+    Module proxy that defers the actual import until first attribute access.
+
+    Selenium's `selenium.webdriver` package imports every browser driver on
+    load, so importing it at module level makes test collection pay for it.
+    Usage:
+        EC = LazyModule("selenium.webdriver.support.expected_conditions")
+        EC.presence_of_element_located(locator)  # imported here, once
+    """
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        """
+        Args:
+            name: Dotted module name to import on first use.
+        """
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
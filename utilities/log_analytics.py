@@ -0,0 +1,462 @@
+# utilities/log_analytics.py
+"""
+Indexed log analytics: per-locator latency tables from logs/*.log.
+
+Log files (including rotated backups like *.log.1) are stream-parsed line
+by line, incrementally: only bytes appended since the last run are read.
+Page operations are extracted from the BasePage messages, e.g.
+    Attempting to click element: ('xpath', ...)   -> start of a click
+    Successfully clicked element: ('xpath', ...)  -> end of a click
+    Element not clickable: ('xpath', ...)         -> end of a click (timeout)
+An operation's latency is measured from its start message, matched by
+logger, operation and locator. Ends without a start (e.g. logs written
+before BasePage logged start messages) are counted as "unpaired", and
+starts still open when the next test begins (the operation raised before
+logging an end) are counted as "abandoned" timeouts. Neither is part of
+the latency distribution.
+
+Operations are attributed to the test running at that time (from the
+"Executing Test Case ..." / "===== Starting test ..." markers) and stored
+as latency histograms in SQLite, keyed by day, test, page class, locator
+and operation. Queries aggregate histogram rows only, so they stay fast
+over months of logs.
+
+Usage:
+    python -m utilities.log_analytics index [--logs logs]
+    python -m utilities.log_analytics stats [--by page,locator,op] [--page HomePage]
+                                            [--locator Login] [--test "Test Case 6"] [--since 2025-08-01]
+"""
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+from bisect import bisect_right
+from functools import lru_cache
+
+LOG_DIR = "logs"
+INDEX_FILE = "log_index.sqlite"
+# Bumped when the way operations are extracted changes; older indexes are rebuilt
+INDEX_VERSION = 3
+BATCH_SIZE = 5000
+
+LINE_RE = re.compile(
+    r"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)(?:[.,](\d{3}))? - (.+?) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$"
+)
+
+# Start-of-operation messages: (pattern, operation)
+START_PATTERNS = [
+    (re.compile(r"^Attempting to find element: (.*)$"), "find"),
+    (re.compile(r"^Attempting to click element: (.*)$"), "click"),
+    (re.compile(r"^Attempting to get text from element: (.*)$"), "get_text"),
+    (re.compile(r"^Waiting for element to be visible: (.*)$"), "visible"),
+    (re.compile(r"^Waiting for element to be clickable: (.*)$"), "clickable"),
+    (re.compile(r"^Navigating to URL: (.*)$"), "navigate"),
+]
+
+# End-of-operation messages: (pattern, operation, timed out)
+OPERATION_PATTERNS = [
+    (re.compile(r"^Found element: (.*)$"), "find", False),
+    (re.compile(r"^Successfully clicked element: (.*)$"), "click", False),
+    (re.compile(r"^Element not clickable: (.*)$"), "click", True),
+    (re.compile(r"^Element is visible: (.*)$"), "visible", False),
+    (re.compile(r"^Element is now visible: (.*)$"), "visible", False),
+    (re.compile(r"^Element not visible within \S+: (.*)$"), "visible", True),
+    (re.compile(r"^Element is clickable: (.*)$"), "clickable", False),
+    (re.compile(r"^Element not present: (.*)$"), "clickable", True),
+    (re.compile(r"^Element not clickable within \S+: (.*)$"), "clickable", True),
+    (re.compile(r"^Retrieved text '.*' from element: (.*)$"), "get_text", False),
+    (re.compile(r"^Failed to get text from element: (.*)$"), "get_text", True),
+    (re.compile(r"^Element not found within timeout: (.*)$"), "find", True),
+    (re.compile(r"^Navigated to URL: (.*)$"), "navigate", False),
+]
+# Older logs have no get_text start; its lookup's start is used instead
+FALLBACK_START = {"get_text": "find"}
+# Started operations awaiting their end, per file (oldest abandoned first)
+MAX_PENDING = 1000
+# Histogram buckets of operations without a start message / without an end message
+UNPAIRED = -1
+ABANDONED = -2
+
+# Test boundaries (from the test class and test_logger fixture loggers)
+TEST_START_RES = [re.compile(r"^Executing (Test Case \d+.*)$"), re.compile(r"^===== Starting test: (.*) =====$")]
+TEST_END_RES = [re.compile(r"^(Test Case \d+) passed"), re.compile(r"^===== Completed test: (.*) =====$")]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE, head TEXT, offset INTEGER, state TEXT
+);
+CREATE TABLE IF NOT EXISTS tests (
+    file_id INTEGER, name TEXT, start REAL, end REAL
+);
+CREATE INDEX IF NOT EXISTS tests_start ON tests (start);
+CREATE TABLE IF NOT EXISTS hist (
+    file_id INTEGER, day TEXT, test TEXT, page TEXT, locator TEXT, op TEXT, bucket INTEGER,
+    count INTEGER, timeouts INTEGER, total_ms REAL, max_ms REAL,
+    PRIMARY KEY (file_id, day, test, page, locator, op, bucket)
+);
+CREATE INDEX IF NOT EXISTS hist_locator ON hist (locator, op);
+CREATE INDEX IF NOT EXISTS hist_page ON hist (page, op);
+CREATE INDEX IF NOT EXISTS hist_test ON hist (test);
+CREATE INDEX IF NOT EXISTS hist_day ON hist (day);
+"""
+
+
+def bucket_for(latency_ms):
+    """Log-scale histogram bucket (10 per decade) for a latency in ms."""
+    if latency_ms < 1:
+        return 0
+    return int(math.floor(math.log10(latency_ms) * 10)) + 1
+
+
+def bucket_upper_ms(bucket):
+    """Upper bound of a histogram bucket in ms."""
+    return 1.0 if bucket == 0 else 10 ** (bucket / 10.0)
+
+
+@lru_cache(maxsize=4096)
+def _epoch(stamp):
+    """Epoch seconds for a log timestamp (cached: many lines share a second)."""
+    return time.mktime(time.strptime(stamp, "%Y-%m-%d %H:%M:%S"))
+
+
+def parse_line(line):
+    """
+    Parse one log line.
+    Returns:
+        tuple: (epoch seconds, logger name, message) or None for other lines.
+    """
+    match = LINE_RE.match(line)
+    if not match:
+        return None
+    stamp, millis, name, _, message = match.groups()
+    ts = _epoch(stamp) + int(millis or 0) / 1000.0
+    return ts, name, message
+
+
+def _iter_lines(path, start, end):
+    """Stream complete lines between two byte offsets, yielding (text, end offset)."""
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        position = start
+        while position < end:
+            raw = fh.readline()
+            if not raw or not raw.endswith(b"\n"):
+                break  # Partial line still being written
+            position += len(raw)
+            yield raw.decode("utf-8", errors="replace").rstrip("\r\n"), position
+
+
+def _head(path):
+    """Hash of the first bytes of a file, to detect rotation/replacement."""
+    with open(path, "rb") as fh:
+        return hashlib.sha1(fh.read(256)).hexdigest()
+
+
+class LogIndex:
+    """SQLite index of operation latency histograms built from log files."""
+
+    def __init__(self, db_path=None, log_dir=LOG_DIR):
+        """
+        Args:
+            db_path: Index database path (default: <log_dir>/log_index.sqlite).
+            log_dir: Directory containing *.log files and rotated backups.
+        """
+        self.log_dir = log_dir
+        self.db_path = db_path or os.path.join(log_dir, INDEX_FILE)
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.db = sqlite3.connect(self.db_path)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self.db.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS tests; DROP TABLE IF EXISTS hist;")
+            self.db.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _log_files(self):
+        patterns = [os.path.join(self.log_dir, "*.log"), os.path.join(self.log_dir, "*.log.*")]
+        return sorted({p for pattern in patterns for p in glob.glob(pattern)
+                       if not p.endswith((".sqlite", ".sqlite-journal"))})
+
+    def _pending_ranges(self):
+        """Work out which byte range of every log file still needs indexing."""
+        ranges = []
+        for path in self._log_files():
+            size = os.path.getsize(path)
+            if size == 0:
+                continue
+            head = _head(path)
+            row = self.db.execute("SELECT id, head, offset, state FROM files WHERE path = ?", (path,)).fetchone()
+            if row is None:
+                cursor = self.db.execute("INSERT INTO files (path, head, offset, state) VALUES (?, ?, 0, '{}')",
+                                         (path, head))
+                file_id, offset, state = cursor.lastrowid, 0, {}
+            else:
+                file_id, old_head, offset, state = row[0], row[1], row[2], json.loads(row[3])
+                if old_head != head or size < offset:
+                    # Rotated or replaced: drop what was indexed from this path
+                    self.db.execute("DELETE FROM hist WHERE file_id = ?", (file_id,))
+                    self.db.execute("DELETE FROM tests WHERE file_id = ?", (file_id,))
+                    self.db.execute("UPDATE files SET head = ? WHERE id = ?", (head, file_id))
+                    offset, state = 0, {}
+            if offset < size:
+                ranges.append((file_id, path, offset, size, state))
+        return ranges
+
+    def _index_tests(self, file_id, path, start, end, state):
+        """Pass 1: record test start/end markers."""
+        current = state.get("test")
+        for line, _ in _iter_lines(path, start, end):
+            if "Test" not in line and "test" not in line:
+                continue  # Cheap pre-filter before parsing
+            parsed = parse_line(line)
+            if parsed is None:
+                continue
+            ts, _, message = parsed
+            for pattern in TEST_START_RES:
+                match = pattern.match(message)
+                if match:
+                    self.db.execute("UPDATE tests SET end = ? WHERE file_id = ? AND end IS NULL", (ts, file_id))
+                    self.db.execute("INSERT INTO tests (file_id, name, start, end) VALUES (?, ?, ?, NULL)",
+                                    (file_id, match.group(1), ts))
+                    current = match.group(1)
+            for pattern in TEST_END_RES:
+                if current and pattern.match(message):
+                    self.db.execute("UPDATE tests SET end = ? WHERE file_id = ? AND end IS NULL", (ts, file_id))
+                    current = None
+        state["test"] = current
+
+    def _load_tests(self):
+        """Test intervals sorted by start time, for attribution by bisection."""
+        rows = self.db.execute("SELECT start, end, name FROM tests ORDER BY start").fetchall()
+        return [r[0] for r in rows], rows
+
+    def _index_operations(self, file_id, path, start, end, state, tests):
+        """
+        Pass 2: extract operations and add them to the histograms.
+        Returns:
+            int: Offset just after the last complete line read.
+        """
+        starts, intervals = tests
+        pending = state.get("pending", {})  # "logger|op|locator" -> start time
+        # Older logs only have find starts, and successful finds logged no end,
+        # so open starts are only abandoned once the file logs start messages
+        # for every operation
+        paired = state.get("paired", False)
+        batch = {}
+
+        def flush():
+            self.db.executemany(
+                """INSERT INTO hist (file_id, day, test, page, locator, op, bucket, count, timeouts, total_ms, max_ms)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (file_id, day, test, page, locator, op, bucket) DO UPDATE SET
+                   count = count + excluded.count, timeouts = timeouts + excluded.timeouts,
+                   total_ms = total_ms + excluded.total_ms, max_ms = MAX(max_ms, excluded.max_ms)""",
+                [key + tuple(value) for key, value in batch.items()])
+            batch.clear()
+
+        def add(ts, page, locator, op, bucket, latency_ms, timed_out):
+            test = "(unknown)"
+            position = bisect_right(starts, ts) - 1
+            if position >= 0:
+                t_start, t_end, t_name = intervals[position]
+                if t_end is None or ts <= t_end:
+                    test = t_name
+            day = time.strftime("%Y-%m-%d", time.localtime(ts))
+            key = (file_id, day, test, page, locator, op, bucket)
+            value = batch.setdefault(key, [0, 0, 0.0, 0.0])
+            value[0] += 1
+            value[1] += 1 if timed_out else 0
+            value[2] += latency_ms
+            value[3] = max(value[3], latency_ms)
+            if len(batch) >= BATCH_SIZE:
+                flush()
+
+        def abandon(key):
+            began = pending.pop(key)
+            if paired:
+                page, op, locator = key.split("|", 2)
+                add(began, page, locator, op, ABANDONED, 0.0, True)
+
+        offset = start
+        for line, offset in _iter_lines(path, start, end):
+            parsed = parse_line(line)
+            if parsed is None:
+                continue
+            ts, page, message = parsed
+            if pending and any(p.match(message) for p in TEST_START_RES + TEST_END_RES):
+                for key in list(pending):
+                    abandon(key)
+                continue
+
+            started = False
+            for pattern, op in START_PATTERNS:
+                match = pattern.match(message)
+                if match:
+                    paired = paired or op != "find"
+                    key = f"{page}|{op}|{match.group(1)}"
+                    if key in pending:
+                        abandon(key)
+                    pending[key] = ts
+                    while len(pending) > MAX_PENDING:
+                        abandon(next(iter(pending)))
+                    started = True
+                    break
+            if started:
+                continue
+
+            for pattern, op, timed_out in OPERATION_PATTERNS:
+                match = pattern.match(message)
+                if not match:
+                    continue
+                locator = match.group(1)
+                began = pending.pop(f"{page}|{op}|{locator}", None)
+                if began is None and op in FALLBACK_START:
+                    began = pending.pop(f"{page}|{FALLBACK_START[op]}|{locator}", None)
+                if began is None:
+                    add(ts, page, locator, op, UNPAIRED, 0.0, timed_out)
+                else:
+                    latency_ms = max(0.0, (ts - began) * 1000.0)
+                    add(ts, page, locator, op, bucket_for(latency_ms), latency_ms, timed_out)
+                break
+
+        flush()
+        state["pending"] = pending
+        state["paired"] = paired
+        return offset
+
+    def update(self):
+        """
+        Index everything appended to the log files since the last update.
+        Returns:
+            int: Number of bytes indexed.
+        """
+        ranges = self._pending_ranges()
+        for file_id, path, start, end, state in ranges:
+            self._index_tests(file_id, path, start, end, state)
+        tests = self._load_tests()
+        indexed = 0
+        for file_id, path, start, end, state in ranges:
+            # Resume after the last complete line next time
+            offset = self._index_operations(file_id, path, start, end, state, tests)
+            indexed += offset - start
+            self.db.execute("UPDATE files SET offset = ?, state = ? WHERE id = ?",
+                            (offset, json.dumps(state), file_id))
+        self.db.commit()
+        return indexed
+
+    def stats(self, by=("page", "locator", "op"), page=None, locator=None, test=None, op=None, since=None):
+        """
+        Latency distribution and timeout rate per group.
+        Args:
+            by: Columns to group by (any of day, test, page, locator, op).
+            page, op: Exact filters. locator, test: Substring filters.
+            since: Only days on/after this date (YYYY-MM-DD).
+        Returns:
+            list: Dicts with the group columns plus count, timeout_rate, unpaired (ends
+                  without a start message), abandoned (starts without an end, counted as
+                  timeouts) and mean/p50/p90/p99/max (ms) of the paired ones (None if there
+                  are none).
+        """
+        allowed = ("day", "test", "page", "locator", "op")
+        by = [column for column in by if column in allowed] or ["page", "locator", "op"]
+        where, params = [], []
+        for column, value, exact in (("page", page, True), ("op", op, True),
+                                     ("locator", locator, False), ("test", test, False)):
+            if value:
+                where.append(f"{column} = ?" if exact else f"{column} LIKE ?")
+                params.append(value if exact else f"%{value}%")
+        if since:
+            where.append("day >= ?")
+            params.append(since)
+        columns = ", ".join(by)
+        sql = (f"SELECT {columns}, bucket, SUM(count), SUM(timeouts), SUM(total_ms), MAX(max_ms) FROM hist"
+               f"{' WHERE ' + ' AND '.join(where) if where else ''} GROUP BY {columns}, bucket ORDER BY {columns}, bucket")
+
+        groups = {}
+        for row in self.db.execute(sql, params):
+            key = row[:len(by)]
+            bucket, count, timeouts, total_ms, max_ms = row[len(by):]
+            groups.setdefault(key, []).append((bucket, count, timeouts, total_ms, max_ms))
+
+        results = []
+        for key, buckets in groups.items():
+            count = sum(b[1] for b in buckets)
+            paired = [b for b in buckets if b[0] not in (UNPAIRED, ABANDONED)]
+            timed = sum(b[1] for b in paired)
+            entry = dict(zip(by, key))
+            entry.update(count=count,
+                         timeout_rate=round(sum(b[2] for b in buckets) / count, 3),
+                         unpaired=sum(b[1] for b in buckets if b[0] == UNPAIRED),
+                         abandoned=sum(b[1] for b in buckets if b[0] == ABANDONED))
+            if not timed:
+                entry.update(mean_ms=None, p50_ms=None, p90_ms=None, p99_ms=None, max_ms=None)
+                results.append(entry)
+                continue
+            entry.update(mean_ms=round(sum(b[3] for b in paired) / timed, 1),
+                         max_ms=round(max(b[4] for b in paired), 1))
+            for name, quantile in (("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99)):
+                target, seen = quantile * timed, 0
+                for bucket, bucket_count, _, _, _ in paired:
+                    seen += bucket_count
+                    if seen >= target:
+                        entry[name] = round(min(bucket_upper_ms(bucket), entry["max_ms"]), 1)
+                        break
+            results.append(entry)
+        return results
+
+
+def _print_table(rows, columns):
+    if not rows:
+        print("No operations found.")
+        return
+    cells = [{c: "-" if r.get(c) is None else str(r[c]) for c in columns} for r in rows]
+    widths = {c: max(len(c), *(len(cell[c]) for cell in cells)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for cell in cells:
+        print("  ".join(cell[c].ljust(widths[c]) for c in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-locator latency tables from logs/*.log")
+    parser.add_argument("--logs", default=LOG_DIR, help="Log directory")
+    parser.add_argument("--db", default=None, help="Index database (default: <logs>/log_index.sqlite)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("index", help="Index new log data")
+    stats = sub.add_parser("stats", help="Show latency distribution and timeout rate (indexes first)")
+    stats.add_argument("--by", default="page,locator,op", help="Comma separated: day,test,page,locator,op")
+    stats.add_argument("--page")
+    stats.add_argument("--locator", help="Substring of the locator")
+    stats.add_argument("--test", help="Substring of the test name")
+    stats.add_argument("--op", help="click, visible, clickable, get_text, find or navigate")
+    stats.add_argument("--since", help="YYYY-MM-DD")
+    stats.add_argument("--sort", default="p90_ms", help="Column to sort by, descending")
+    stats.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    index = LogIndex(args.db, args.logs)
+    try:
+        started = time.perf_counter()
+        indexed = index.update()
+        if args.command == "index":
+            print(f"Indexed {indexed} bytes in {time.perf_counter() - started:.2f}s -> {index.db_path}")
+            return 0
+        by = [c.strip() for c in args.by.split(",") if c.strip()]
+        rows = index.stats(by, page=args.page, locator=args.locator, test=args.test, op=args.op, since=args.since)
+        rows.sort(key=lambda r: r.get(args.sort) or 0, reverse=True)
+        _print_table(rows[:args.limit], by + ["count", "timeout_rate", "unpaired", "abandoned", "mean_ms", "p50_ms",
+                                              "p90_ms", "p99_ms", "max_ms"])
+        print(f"({len(rows)} group(s), {time.perf_counter() - started:.3f}s)")
+        return 0
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,8 +35,8 @@ def setup_logger(name=None):
     if not logger.handlers:
         # Create formatter with standardized format
         formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'  # Human-readable timestamp format
+            '%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'  # Human-readable timestamp format (milliseconds added for latency analysis)
         )
         
         # Configure rotating file handler
@@ -61,6 +61,14 @@ def setup_logger(name=None):
     
     return logger
 
-# Create and export a default logger instance
-# This can be imported directly from other modules as 'from utilities.logger import logger'
-logger = setup_logger()  # Instance with default name "guvi_automation"
\ No newline at end of file
+def __getattr__(name):
+    """
+    Create the default logger instance on first access.
+    `from utilities.logger import logger` still works, but merely importing
+    this module no longer creates a logger or opens a log file.
+    """
+    if name == "logger":
+        default = setup_logger()  # Instance with default name "guvi_automation"
+        globals()["logger"] = default
+        return default
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
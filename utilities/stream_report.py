@@ -0,0 +1,188 @@
+# utilities/stream_report.py
+import json
+import os
+import re
+import shutil
+import time
+
+import pytest
+
+# Records per segment file; the viewer loads one segment per page range
+SEGMENT_SIZE = 200
+VIEWER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "report_viewer.html")
+
+
+def _safe_name(nodeid):
+    """Turn a node id into a file-system safe artifact name."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[:150]
+
+
+class StreamReportWriter:
+    """
+    Append-only, segmented NDJSON report.
+
+    Layout of the report directory:
+    - manifest.json: run status, totals and the list of segments (rewritten
+      atomically after every record, so it is always consistent)
+    - records-0000.ndjson, records-0001.ndjson, ...: one JSON record per line
+    - artifacts/: screenshots and other files referenced by records
+    - index.html: static viewer that lazy-loads and paginates segments
+
+    Only counters are kept in memory, so memory use does not grow with the
+    number of tests.
+    """
+
+    def __init__(self, directory, segment_size=SEGMENT_SIZE):
+        """
+        Args:
+            directory: Report directory (created if missing, previous records and artifacts are replaced).
+            segment_size: Records per segment file.
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.artifacts_dir = os.path.join(directory, "artifacts")
+        shutil.rmtree(self.artifacts_dir, ignore_errors=True)
+        os.makedirs(self.artifacts_dir, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.startswith("records-") and name.endswith(".ndjson"):
+                os.remove(os.path.join(directory, name))
+        if os.path.exists(VIEWER_FILE):
+            shutil.copyfile(VIEWER_FILE, os.path.join(directory, "index.html"))
+
+        self.manifest = {
+            "status": "running",
+            "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "updated": None,
+            "total": 0,
+            "summary": {},
+            "segment_size": segment_size,
+            "segments": [],
+        }
+        self._segment = None
+        self._write_manifest()
+
+    def _open_segment(self):
+        """Start a new segment file."""
+        if self._segment is not None:
+            self._segment.close()
+        name = f"records-{len(self.manifest['segments']):04d}.ndjson"
+        self.manifest["segments"].append({"file": name, "count": 0})
+        self._segment = open(os.path.join(self.directory, name), "a", encoding="utf-8")
+
+    def _write_manifest(self):
+        """Atomically replace manifest.json."""
+        self.manifest["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        tmp_path = os.path.join(self.directory, "manifest.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(self.manifest, fh)
+        os.replace(tmp_path, os.path.join(self.directory, "manifest.json"))
+
+    def write(self, record):
+        """
+        Append one test record and make it visible to the viewer.
+        Args:
+            record: JSON-serialisable dict with at least "nodeid" and "outcome".
+        """
+        segments = self.manifest["segments"]
+        if self._segment is None or segments[-1]["count"] >= self.segment_size:
+            self._open_segment()
+        self._segment.write(json.dumps(record, default=str) + "\n")
+        self._segment.flush()
+
+        segments[-1]["count"] += 1
+        self.manifest["total"] += 1
+        summary = self.manifest["summary"]
+        summary[record["outcome"]] = summary.get(record["outcome"], 0) + 1
+        self._write_manifest()
+
+    def close(self, status="finished"):
+        """Mark the run as finished."""
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+        self.manifest["status"] = status
+        self._write_manifest()
+
+
+class StreamReportPlugin:
+    """
+    Pytest plugin streaming one record per test into a StreamReportWriter
+    as soon as the test's teardown finishes. Screenshots of failing browser
+    tests are saved into the report's artifacts directory.
+    Under pytest-xdist, workers only capture artifacts; the controller writes.
+    """
+
+    def __init__(self, config, directory):
+        self.config = config
+        self.directory = os.path.abspath(directory)
+        self.is_worker = hasattr(config, "workerinput")
+        self.writer = None
+        self._phases = {}
+
+    def pytest_sessionstart(self, session):
+        if not self.is_worker:
+            self.writer = StreamReportWriter(self.directory)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "call" or not report.failed:
+            return
+        driver = getattr(item.cls, "driver", None) if item.cls else None
+        if driver is None:
+            return
+        rel_path = f"artifacts/{_safe_name(item.nodeid)}.png"
+        try:
+            os.makedirs(os.path.join(self.directory, "artifacts"), exist_ok=True)
+            driver.save_screenshot(os.path.join(self.directory, rel_path))
+            report.user_properties.append(("artifact", rel_path))
+        except Exception:
+            pass  # The browser may be gone; the record is still written
+
+    def pytest_runtest_logreport(self, report):
+        if self.writer is None:
+            return
+        phases = self._phases.setdefault(report.nodeid, [])
+        phases.append(report)
+        if report.when != "teardown":
+            return
+        del self._phases[report.nodeid]
+
+        outcome, longrepr = "passed", None
+        for phase in phases:
+            if phase.failed:
+                outcome = "failed" if phase.when == "call" else "error"
+                longrepr = str(phase.longrepr)
+                break
+            if phase.skipped:
+                outcome = "skipped"
+                longrepr = str(phase.longrepr)
+
+        # Phase reports share the item's user_properties, so de-duplicate
+        properties, seen = [], set()
+        for phase in phases:
+            for key, value in phase.user_properties:
+                marker = json.dumps([key, value], default=str)
+                if marker not in seen:
+                    seen.add(marker)
+                    properties.append((key, value))
+        self.writer.write({
+            "nodeid": report.nodeid,
+            "outcome": outcome,
+            "duration": round(sum(p.duration for p in phases), 3),
+            "phases": {p.when: round(p.duration, 3) for p in phases},
+            "finished": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "worker": getattr(report, "worker_id", None),  # Set by pytest-xdist
+            "longrepr": longrepr,
+            "artifacts": [value for key, value in properties if key == "artifact"],
+            "properties": {str(k): v for k, v in properties if k != "artifact"},
+        })
+
+    def pytest_sessionfinish(self, session):
+        if self.writer is not None:
+            self.writer.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.writer is not None:
+            terminalreporter.write_line(f"stream report: {os.path.join(self.directory, 'index.html')}")
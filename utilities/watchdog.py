@@ -0,0 +1,218 @@
+# utilities/watchdog.py
+import csv
+import os
+import threading
+import time
+from datetime import datetime
+from utilities.config import Config
+from utilities.devtools import page_session, page_target_id
+from utilities.logger import setup_logger
+
+PROC_DIR = "/proc"  # Process information (Linux only)
+
+
+def _rss_kb(pid):
+    """Resident set size of one process in kB (Linux /proc), or None if unavailable."""
+    try:
+        with open(f"{PROC_DIR}/{pid}/status", "r") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _descendants(root_pid):
+    """
+    All descendant pids of a process (browser and renderers under chromedriver).
+    Reads the parent pid of every process from /proc/<pid>/stat.
+    """
+    children = {}
+    try:
+        entries = os.listdir(PROC_DIR)
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"{PROC_DIR}/{entry}/stat", "r") as fh:
+                # Format: pid (comm) state ppid ... ; comm may contain spaces
+                ppid = int(fh.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    found, stack = [], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+class SessionWatchdog:
+    """
+    Background thread that samples a browser session's resource usage:
+    - JS heap size and DOM node count (CDP Performance.getMetrics)
+    - RSS of the browser process tree (/proc)
+
+    CDP metrics are read from the tab under test (not a worker or iframe
+    target) over the thread's own DevTools connection, never
+    through the WebDriver the test is driving, so sampling does not queue
+    commands behind the test's (or run them concurrently). Without a CDP
+    connection (e.g. Firefox) only RSS is sampled.
+
+    Every sample is appended to a per-session CSV in logs/ (the memory
+    curve, for tuning thresholds). Once a threshold is crossed the session
+    is flagged; the conftest recycles it before the next test.
+    """
+
+    def __init__(self, driver, session_name, interval=None, max_js_heap_mb=None,
+                 max_dom_nodes=None, max_rss_mb=None):
+        """
+        Args:
+            driver: Selenium WebDriver instance to watch.
+            session_name: Name used for the log and CSV file.
+            interval: Seconds between samples (default: Config.WATCHDOG_INTERVAL).
+            max_js_heap_mb: JS heap threshold (default: Config.WATCHDOG_MAX_JS_HEAP_MB).
+            max_dom_nodes: DOM node threshold (default: Config.WATCHDOG_MAX_DOM_NODES).
+            max_rss_mb: Process tree RSS threshold (default: Config.WATCHDOG_MAX_RSS_MB).
+        """
+        self.driver = driver
+        self.session_name = session_name
+        self.interval = interval if interval is not None else Config.WATCHDOG_INTERVAL
+        self.thresholds = {
+            "js_heap_mb": max_js_heap_mb if max_js_heap_mb is not None else Config.WATCHDOG_MAX_JS_HEAP_MB,
+            "dom_nodes": max_dom_nodes if max_dom_nodes is not None else Config.WATCHDOG_MAX_DOM_NODES,
+            "rss_mb": max_rss_mb if max_rss_mb is not None else Config.WATCHDOG_MAX_RSS_MB,
+        }
+        self.logger = setup_logger("SessionWatchdog")
+        self.recycle_reason = None
+        self.last_sample = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._started_at = None
+        self._target_id = None
+
+        log_dir = os.path.join(os.getcwd(), "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.curve_file = os.path.join(log_dir, f"memory_{session_name}_{timestamp}.csv")
+
+    @property
+    def needs_recycle(self):
+        """True once any threshold has been crossed."""
+        return self.recycle_reason is not None
+
+    def _browser_pid(self):
+        """Pid of the chromedriver process, whose descendants are the browser."""
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        return getattr(process, "pid", None)
+
+    def _rss_mb(self):
+        """RSS of the chromedriver process tree in MB, or None if unavailable."""
+        pid = self._browser_pid()
+        if not pid:
+            return None
+        rss_kb = _rss_kb(pid)
+        if rss_kb is None:
+            return None
+        rss_kb += sum(_rss_kb(child) or 0 for child in _descendants(pid))
+        return round(rss_kb / 1024, 1)
+
+    def sample(self, metrics=None):
+        """
+        Take one sample, append it to the memory curve and check thresholds.
+        Args:
+            metrics: CDP Performance metrics as a name -> value dict (None if unavailable).
+        Returns:
+            dict: The sample.
+        """
+        metrics = metrics or {}
+        heap = metrics.get("JSHeapUsedSize")
+        nodes = metrics.get("Nodes")
+        sample = {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed_s": round(time.time() - (self._started_at or time.time()), 1),
+            "js_heap_mb": round(heap / 1048576, 1) if heap is not None else None,
+            "dom_nodes": int(nodes) if nodes is not None else None,
+            "rss_mb": self._rss_mb(),
+        }
+        self.last_sample = sample
+        self._append(sample)
+
+        if self.recycle_reason is None:
+            for metric, limit in self.thresholds.items():
+                value = sample[metric]
+                if value is not None and value > limit:
+                    self.recycle_reason = f"{metric}={value} exceeds {limit}"
+                    self.logger.warning(f"Session {self.session_name} flagged for recycling: {self.recycle_reason}")
+                    break
+        return sample
+
+    def _append(self, sample):
+        """Append one sample to the session's memory curve CSV."""
+        new_file = not os.path.exists(self.curve_file)
+        with open(self.curve_file, "a", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(sample))
+            if new_file:
+                writer.writeheader()
+            writer.writerow(sample)
+
+    async def _sample_over_cdp(self):
+        """Sampling loop reading metrics over a dedicated DevTools connection."""
+        import trio
+
+        async with page_session(self.driver, self._target_id) as connection:
+            session, devtools = connection.session, connection.devtools
+            await session.execute(devtools.performance.enable())
+            while not self._stop.is_set():
+                try:
+                    metrics = await session.execute(devtools.performance.get_metrics())
+                    values = {metric.name: metric.value for metric in metrics}
+                except Exception as e:
+                    # The page may be mid-navigation; sample RSS only this time
+                    self.logger.debug(f"CDP metrics unavailable: {str(e)}")
+                    values = None
+                try:
+                    self.sample(values)
+                except Exception as e:
+                    self.logger.error(f"Watchdog sample failed: {str(e)}")
+                deadline = trio.current_time() + self.interval
+                while not self._stop.is_set() and trio.current_time() < deadline:
+                    await trio.sleep(min(0.2, self.interval))
+
+    def _run(self):
+        try:
+            import trio
+
+            trio.run(self._sample_over_cdp)
+            return
+        except Exception as e:
+            if self._stop.is_set():
+                return
+            self.logger.warning(f"No CDP connection for {self.session_name}, sampling RSS only: {str(e)}")
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                self.logger.error(f"Watchdog sample failed: {str(e)}")
+
+    def start(self):
+        """Start sampling in a daemon thread."""
+        self._started_at = time.time()
+        self._target_id = page_target_id(self.driver)  # Read here: the driver is not thread-safe
+        self._thread = threading.Thread(target=self._run, name=f"watchdog-{self.session_name}", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Watching session {self.session_name} every {self.interval}s "
+                         f"(limits: {self.thresholds}), curve: {self.curve_file}")
+
+    def stop(self):
+        """Stop sampling and log the last known usage."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.interval + 5)
+        self.logger.info(f"Stopped watching session {self.session_name}, last sample: {self.last_sample}")